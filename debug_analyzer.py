@@ -20,11 +20,8 @@ async def test_improved_analyzer():
     
     print(f"🔍 Analyzing: {url}")
     
-    # Fetch and clean content
-    raw_content = await analyzer.fetch_job_content(url)
-    print(f"📊 Raw content length: {len(raw_content)}")
-    
-    cleaned_content = analyzer._clean_job_text(raw_content)
+    # Fetch and clean content in one streamed pass
+    cleaned_content = await analyzer.fetch_and_clean(url)
     print(f"📊 Cleaned content length: {len(cleaned_content)}")
     
     print("\n" + "="*80)
@@ -39,8 +36,8 @@ async def test_improved_analyzer():
     print("\n" + "="*80)
     print("STRUCTURED ANALYSIS RESULTS:")
     print("="*80)
-    import json
-    print(json.dumps(result, indent=2))
+    import orjson
+    print(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
     print("="*80)
 
 if __name__ == "__main__":
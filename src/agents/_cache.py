@@ -0,0 +1,43 @@
+"""
+In-memory prompt-result cache shared by the agents.
+
+Agent prompts here are deterministic functions of their inputs, so an
+identical prompt against the same model yields equivalent output;
+repeating the call only re-pays LLM latency and token cost. A small TTL
+cache turns those repeats into instant hits while the TTL keeps entries
+from outliving a session.
+"""
+import asyncio
+import hashlib
+
+from cachetools import TTLCache
+
+from ..utils.config import settings
+
+_CACHE: TTLCache = TTLCache(maxsize=256, ttl=3600)
+_LOCK = asyncio.Lock()
+
+
+def _key(prompt: str, run_kwargs: dict) -> str:
+    payload = prompt.encode() + settings.default_model_id.encode()
+    if run_kwargs:
+        payload += repr(sorted(run_kwargs.items())).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+async def cached_run(agent, prompt: str, **run_kwargs):
+    """Run `agent.run(prompt, ...)`, reusing the response for repeated prompts.
+
+    Extra keyword arguments (e.g. response_format) are forwarded to the
+    agent and participate in the cache key, since they change the output.
+    """
+    key = _key(prompt, run_kwargs)
+    async with _LOCK:
+        cached = _CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    result = await agent.run(prompt, **run_kwargs)
+    async with _LOCK:
+        _CACHE[key] = result
+    return result
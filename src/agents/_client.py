@@ -0,0 +1,53 @@
+"""
+Shared AsyncOpenAI client for all agents.
+
+Each agent previously built its own client, so three connection pools
+competed for the same endpoint and every first call per agent paid TCP,
+TLS and DNS setup again. One process-wide client lets the agents share
+keep-alive connections.
+"""
+from functools import lru_cache
+
+import httpx
+from openai import AsyncOpenAI
+
+from ..utils.config import settings
+
+GITHUB_MODELS_BASE_URL = "https://models.github.ai/inference"
+
+
+@lru_cache(maxsize=1)
+def get_async_openai_client() -> AsyncOpenAI:
+    """Return the process-wide AsyncOpenAI client, created on first use.
+
+    Lazy construction (rather than a module-level instance) ensures the
+    underlying httpx transport is created inside the running event loop.
+    """
+    return AsyncOpenAI(
+        base_url=GITHUB_MODELS_BASE_URL,
+        api_key=settings.github_token,
+        http_client=httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+        ),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_batch_openai_client() -> AsyncOpenAI:
+    """Return the api.openai.com client used for the Batch API.
+
+    The GitHub Models endpoint serves chat completions only - it has no
+    /files or /batches routes - so batch work must go to api.openai.com
+    with its own key.
+    """
+    if not settings.openai_api_key:
+        raise RuntimeError(
+            "The Batch API requires openai_api_key (OPENAI_API_KEY) to be "
+            "configured; the GitHub Models endpoint does not serve it."
+        )
+    return AsyncOpenAI(
+        api_key=settings.openai_api_key,
+        http_client=httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+        ),
+    )
@@ -0,0 +1,43 @@
+"""
+Extraction of JSON payloads from freeform LLM responses.
+
+Models often wrap the requested JSON in prose; a single pre-compiled
+regex spanning the outermost object (or array) pulls it out in one scan,
+replacing the find('{')/rfind('}') double pass copied across the agents.
+"""
+import re
+from typing import Any, Optional
+
+import orjson
+
+_JSON_OBJ_RE = re.compile(r'\{.*\}', re.DOTALL)
+_JSON_ARR_RE = re.compile(r'\[.*\]', re.DOTALL)
+
+
+def fmt_for_prompt(obj: Any) -> str:
+    """Serialize a profile/analysis dict for interpolation into a prompt.
+
+    f-string interpolation falls back to dict.__repr__, whose single-quote
+    syntax tokenizes poorly and whose ordering is insertion-dependent.
+    Sorted-key orjson output is compact, cheaper in tokens, and identical
+    across calls - which keeps the prompt-cache keys and provider prefix
+    caching stable.
+    """
+    if isinstance(obj, (dict, list)):
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode()
+    return str(obj)
+
+
+def parse_llm_json(text: str, list_mode: bool = False) -> Optional[Any]:
+    """Parse the outermost JSON object (or array) found in `text`.
+
+    Returns None when no JSON is present or it fails to parse, so callers
+    can fall back to their unoptimized defaults.
+    """
+    match = (_JSON_ARR_RE if list_mode else _JSON_OBJ_RE).search(text)
+    if match is None:
+        return None
+    try:
+        return orjson.loads(match.group(0))
+    except orjson.JSONDecodeError:
+        return None
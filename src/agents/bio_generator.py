@@ -1,18 +1,19 @@
-from typing import Dict, Any
+import asyncio
+from types import MappingProxyType
+from typing import Dict, Any, ClassVar, Mapping
 from agent_framework import ChatAgent
 from agent_framework.openai import OpenAIChatClient
-from openai import AsyncOpenAI
 from ..utils.config import settings
+from ._client import get_async_openai_client
+from ._cache import cached_run
+from ._json import fmt_for_prompt
 
 
 class BioGeneratorAgent:
     """AI agent for generating professional bios for presentations and profiles."""
     
     def __init__(self):
-        self.openai_client = AsyncOpenAI(
-            base_url="https://models.github.ai/inference",
-            api_key=settings.github_token,
-        )
+        self.openai_client = get_async_openai_client()
         self.chat_client = OpenAIChatClient(
             async_client=self.openai_client,
             model_id=settings.default_model_id
@@ -20,11 +21,12 @@ class BioGeneratorAgent:
         self.agent = ChatAgent(
             chat_client=self.chat_client,
             name="BioGenerator",
-            instructions=self._get_system_instructions(),
+            instructions=self._SYSTEM_INSTRUCTIONS,
         )
     
-    def _get_system_instructions(self) -> str:
-        return """
+    # Instructions are static, so hold them once on the class instead
+    # of rebuilding the literal through a method call per construction.
+    _SYSTEM_INSTRUCTIONS: ClassVar[str] = """
         You are an expert professional bio writer. Your task is to create compelling, concise professional bios that:
         
         1. Capture the person's professional essence
@@ -41,35 +43,40 @@ class BioGeneratorAgent:
         - Keep within specified length requirements
         - Make it memorable and authentic
         """
+
+    @classmethod
+    def _get_system_instructions(cls) -> str:
+        return cls._SYSTEM_INSTRUCTIONS
     
-    async def generate_professional_bio(
+    # Constant across calls, so build once at class scope; the proxy keeps
+    # it read-only.
+    _LENGTH_GUIDELINES: ClassVar[Mapping[str, str]] = MappingProxyType({
+        "short": "50-75 words (elevator pitch)",
+        "medium": "100-150 words (one paragraph)",
+        "long": "200-300 words (multiple paragraphs)"
+    })
+
+    def _build_bio_prompt(
         self,
         user_profile: Dict[str, Any],
-        job_context: Dict[str, Any] = None,
-        length: str = "medium",  # short, medium, long
-        style: str = "professional",  # professional, creative, academic
-        context: str = "general"  # presentation, linkedin, conference, company
+        job_context: Dict[str, Any],
+        length: str,
+        style: str,
+        context: str
     ) -> str:
-        """Generate a professional bio tailored for specific context."""
-        
-        # Define length guidelines
-        length_guidelines = {
-            "short": "50-75 words (elevator pitch)",
-            "medium": "100-150 words (one paragraph)", 
-            "long": "200-300 words (multiple paragraphs)"
-        }
-        
-        bio_prompt = f"""
+        """Build the bio prompt shared by the buffered and streaming paths."""
+
+        return f"""
         Create a compelling professional bio with these specifications:
 
         USER PROFILE:
-        {user_profile}
+        {fmt_for_prompt(user_profile)}
 
         JOB CONTEXT (if applicable):
-        {job_context or 'General professional bio'}
+        {fmt_for_prompt(job_context) if job_context else 'General professional bio'}
 
         BIO SPECIFICATIONS:
-        - Length: {length} ({length_guidelines.get(length, '100-150 words')})
+        - Length: {length} ({self._LENGTH_GUIDELINES.get(length, '100-150 words')})
         - Style: {style}
         - Context: {context}
         - Perspective: Third person
@@ -84,10 +91,53 @@ class BioGeneratorAgent:
 
         Return only the bio text, no additional formatting or explanations.
         """
-        
-        result = await self.agent.run(bio_prompt)
+
+    async def generate_professional_bio(
+        self,
+        user_profile: Dict[str, Any],
+        job_context: Dict[str, Any] = None,
+        length: str = "medium",  # short, medium, long
+        style: str = "professional",  # professional, creative, academic
+        context: str = "general"  # presentation, linkedin, conference, company
+    ) -> str:
+        """Generate a professional bio tailored for specific context."""
+
+        bio_prompt = self._build_bio_prompt(user_profile, job_context, length, style, context)
+
+        result = await cached_run(self.agent, bio_prompt)
         return result.text.strip()
-    
+
+    async def stream_professional_bio(
+        self,
+        user_profile: Dict[str, Any],
+        job_context: Dict[str, Any] = None,
+        length: str = "medium",
+        style: str = "professional",
+        context: str = "general"
+    ):
+        """Stream a professional bio as text chunks as the model produces them."""
+
+        bio_prompt = self._build_bio_prompt(user_profile, job_context, length, style, context)
+
+        async for update in self.agent.run_stream(bio_prompt):
+            if update.text:
+                yield update.text
+
+    async def generate_all(self, user_profile: Dict[str, Any]) -> Dict[str, str]:
+        """Generate every bio format for a profile concurrently.
+
+        Fires four API calls at once - the formats are independent, so the
+        wall-clock cost is roughly one generation instead of four.
+        """
+        tasks = {
+            'presentation': self.generate_presentation_bio(user_profile),
+            'linkedin': self.generate_linkedin_summary(user_profile),
+            'executive': self.generate_executive_summary(user_profile),
+            'elevator': self.generate_elevator_pitch(user_profile),
+        }
+        results = await asyncio.gather(*tasks.values())
+        return dict(zip(tasks, results))
+
     async def generate_presentation_bio(
         self,
         user_profile: Dict[str, Any],
@@ -100,7 +150,7 @@ class BioGeneratorAgent:
         Create a one-page professional bio perfect for PowerPoint presentations:
 
         USER PROFILE:
-        {user_profile}
+        {fmt_for_prompt(user_profile)}
 
         PRESENTATION CONTEXT:
         - Topic: {presentation_topic or 'General professional presentation'}
@@ -118,7 +168,7 @@ class BioGeneratorAgent:
         Focus on credibility and expertise that supports the presentation topic.
         """
         
-        result = await self.agent.run(presentation_prompt)
+        result = await cached_run(self.agent, presentation_prompt)
         return result.text.strip()
     
     async def generate_linkedin_summary(
@@ -133,10 +183,10 @@ class BioGeneratorAgent:
         Create an optimized LinkedIn summary for professional networking and job opportunities:
 
         USER PROFILE:
-        {user_profile}
+        {fmt_for_prompt(user_profile)}
 
         TARGET ROLES:
-        {target_roles or 'General career advancement'}
+        {fmt_for_prompt(target_roles) if target_roles else 'General career advancement'}
 
         INDUSTRY FOCUS:
         {industry_focus or 'Current industry'}
@@ -154,7 +204,7 @@ class BioGeneratorAgent:
         Format as LinkedIn-ready text with natural paragraph breaks.
         """
         
-        result = await self.agent.run(linkedin_prompt)
+        result = await cached_run(self.agent, linkedin_prompt)
         return result.text.strip()
     
     async def generate_executive_summary(
@@ -168,7 +218,7 @@ class BioGeneratorAgent:
         Create a high-level executive summary for {executive_level} leadership contexts:
 
         USER PROFILE:
-        {user_profile}
+        {fmt_for_prompt(user_profile)}
 
         EXECUTIVE LEVEL: {executive_level}
 
@@ -184,7 +234,7 @@ class BioGeneratorAgent:
         Style should reflect the gravitas and accomplishments expected at the {executive_level} level.
         """
         
-        result = await self.agent.run(exec_prompt)
+        result = await cached_run(self.agent, exec_prompt)
         return result.text.strip()
     
     async def generate_elevator_pitch(
@@ -198,7 +248,7 @@ class BioGeneratorAgent:
         Create a compelling 30-second elevator pitch:
 
         USER PROFILE:
-        {user_profile}
+        {fmt_for_prompt(user_profile)}
 
         TARGET AUDIENCE: {target_audience}
 
@@ -213,5 +263,5 @@ class BioGeneratorAgent:
         Make it punchy, confident, and tailored to {target_audience}.
         """
         
-        result = await self.agent.run(pitch_prompt)
+        result = await cached_run(self.agent, pitch_prompt)
         return result.text.strip()
\ No newline at end of file
@@ -1,18 +1,21 @@
-from typing import Dict, Any, List
+import asyncio
+from pathlib import Path
+from typing import Dict, Any, List, Tuple, Optional, ClassVar
+
+import orjson
 from agent_framework import ChatAgent
 from agent_framework.openai import OpenAIChatClient
-from openai import AsyncOpenAI
 from ..utils.config import settings
+from ._client import get_async_openai_client, get_batch_openai_client
+from ._cache import cached_run
+from ._json import fmt_for_prompt, parse_llm_json
 
 
 class CVTailorAgent:
     """AI agent for generating tailored CVs based on job requirements and user profile."""
     
     def __init__(self):
-        self.openai_client = AsyncOpenAI(
-            base_url="https://models.github.ai/inference",
-            api_key=settings.github_token,
-        )
+        self.openai_client = get_async_openai_client()
         self.chat_client = OpenAIChatClient(
             async_client=self.openai_client,
             model_id=settings.default_model_id
@@ -20,11 +23,12 @@ class CVTailorAgent:
         self.agent = ChatAgent(
             chat_client=self.chat_client,
             name="CVTailor",
-            instructions=self._get_system_instructions(),
+            instructions=self._SYSTEM_INSTRUCTIONS,
         )
     
-    def _get_system_instructions(self) -> str:
-        return """
+    # Instructions are static, so hold them once on the class instead
+    # of rebuilding the literal through a method call per construction.
+    _SYSTEM_INSTRUCTIONS: ClassVar[str] = """
         You are an expert CV writer and career advisor. Your task is to create tailored, professional CVs that:
         
         1. TRUTHFULLY represent the candidate's actual experience
@@ -44,25 +48,37 @@ class CVTailorAgent:
         
         Always provide CV content in clean Markdown format with proper sections and formatting.
         """
+
+    @classmethod
+    def _get_system_instructions(cls) -> str:
+        return cls._SYSTEM_INSTRUCTIONS
     
-    async def generate_tailored_cv(
-        self, 
-        user_profile: Dict[str, Any], 
-        job_analysis: Dict[str, Any],
-        style: str = "professional",
-        format_type: str = "ats_optimized",
-        include_gap_analysis: bool = True
-    ) -> Dict[str, Any]:
-        """Generate a tailored CV based on user profile and job requirements."""
-        
-        cv_prompt = f"""
-        Create a truthful, tailored CV for this job application:
+    @staticmethod
+    def _format_context(user_profile: Dict[str, Any], job_analysis: Dict[str, Any]) -> str:
+        """Format the shared job/profile context block.
 
-        JOB REQUIREMENTS:
-        {job_analysis}
+        Every prompt in a tailoring session opens with this exact block so
+        provider-side prefix caching can reuse the prefill KV state across
+        successive calls instead of re-processing the same large blobs.
+        """
+        return f"""JOB REQUIREMENTS:
+        {fmt_for_prompt(job_analysis)}
 
         CANDIDATE PROFILE:
-        {user_profile}
+        {fmt_for_prompt(user_profile)}"""
+
+    def _build_cv_prompt(
+        self,
+        user_profile: Dict[str, Any],
+        job_analysis: Dict[str, Any],
+        style: str,
+        format_type: str
+    ) -> str:
+        """Build the CV generation prompt shared by the buffered and streaming paths."""
+        return f"""
+        {self._format_context(user_profile, job_analysis)}
+
+        Create a truthful, tailored CV for this job application.
 
         CV REQUIREMENTS:
         - Style: {style}
@@ -78,19 +94,115 @@ class CVTailorAgent:
 
         Generate a complete CV in Markdown format. Prioritize authenticity over perceived impact.
         """
-        
-        result = await self.agent.run(cv_prompt)
-        
-        response = {
+
+    async def generate_tailored_cv(
+        self,
+        user_profile: Dict[str, Any],
+        job_analysis: Dict[str, Any],
+        style: str = "professional",
+        format_type: str = "ats_optimized",
+        include_gap_analysis: bool = True
+    ) -> Dict[str, Any]:
+        """Generate a tailored CV based on user profile and job requirements."""
+
+        cv_prompt = self._build_cv_prompt(user_profile, job_analysis, style, format_type)
+
+        if include_gap_analysis:
+            # The CV and the gap analysis are independent LLM calls, so
+            # run them concurrently instead of back to back.
+            result, gap_analysis = await asyncio.gather(
+                cached_run(self.agent, cv_prompt),
+                self.analyze_profile_gaps(user_profile, job_analysis)
+            )
+        else:
+            result = await cached_run(self.agent, cv_prompt)
+            gap_analysis = None
+
+        return {
             "cv_content": result.text,
-            "gap_analysis": None
+            "gap_analysis": gap_analysis
         }
-        
-        if include_gap_analysis:
-            response["gap_analysis"] = await self.analyze_profile_gaps(user_profile, job_analysis)
-        
-        return response
+
+    async def stream_tailored_cv(
+        self,
+        user_profile: Dict[str, Any],
+        job_analysis: Dict[str, Any],
+        style: str = "professional",
+        format_type: str = "ats_optimized"
+    ):
+        """Stream a tailored CV as text chunks as the model produces them."""
+
+        cv_prompt = self._build_cv_prompt(user_profile, job_analysis, style, format_type)
+
+        async for update in self.agent.run_stream(cv_prompt):
+            if update.text:
+                yield update.text
     
+    async def submit_batch(
+        self,
+        jobs: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+        style: str = "professional",
+        format_type: str = "ats_optimized",
+        batch_file: str = "cv_batch_input.jsonl"
+    ) -> str:
+        """Submit many (profile, job_analysis) pairs via the OpenAI Batch API.
+
+        Batch requests run at half the per-token price with a 24-hour SLA,
+        which suits non-interactive workloads like a nightly CV refresh.
+        Returns the batch id for later polling.
+        """
+        lines = []
+        for index, (user_profile, job_analysis) in enumerate(jobs):
+            prompt = self._build_cv_prompt(user_profile, job_analysis, style, format_type)
+            lines.append(orjson.dumps({
+                "custom_id": f"cv-{index}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": settings.default_model_id,
+                    "messages": [
+                        {"role": "system", "content": self._SYSTEM_INSTRUCTIONS},
+                        {"role": "user", "content": prompt},
+                    ],
+                },
+            }))
+
+        path = Path(batch_file)
+        path.write_bytes(b"\n".join(lines) + b"\n")
+
+        # The Batch API lives on api.openai.com; the shared GitHub
+        # Models client has no /files or /batches routes.
+        client = get_batch_openai_client()
+        with path.open("rb") as f:
+            uploaded = await client.files.create(file=f, purpose="batch")
+        batch = await client.batches.create(
+            input_file_id=uploaded.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        return batch.id
+
+    async def poll_batch(self, batch_id: str) -> Optional[Dict[str, str]]:
+        """Fetch batch results, or None while the batch is still running.
+
+        Returns a mapping of custom_id to generated CV content once the
+        batch has completed.
+        """
+        client = get_batch_openai_client()
+        batch = await client.batches.retrieve(batch_id)
+        if batch.status != "completed":
+            return None
+
+        content = await client.files.content(batch.output_file_id)
+        results = {}
+        for line in content.text.splitlines():
+            if not line:
+                continue
+            entry = orjson.loads(line)
+            body = entry["response"]["body"]
+            results[entry["custom_id"]] = body["choices"][0]["message"]["content"]
+        return results
+
     async def generate_professional_summary(
         self, 
         user_profile: Dict[str, Any], 
@@ -99,19 +211,9 @@ class CVTailorAgent:
         """Generate a targeted professional summary."""
         
         summary_prompt = f"""
-        Create a compelling professional summary (3-4 sentences) for this candidate and job:
+        {self._format_context(user_profile, job_analysis)}
 
-        JOB: {job_analysis.get('job_title', 'Unknown')} at {job_analysis.get('company_name', 'Unknown')}
-        
-        KEY REQUIREMENTS:
-        - Technical Skills: {job_analysis.get('required_skills', {}).get('technical_skills', [])}
-        - Experience: {job_analysis.get('required_skills', {}).get('experience_years', 'Not specified')} years
-        - Education: {job_analysis.get('required_skills', {}).get('education_requirements', [])}
-
-        CANDIDATE BACKGROUND:
-        - Experience: {user_profile.get('work_experience', [])}
-        - Skills: {user_profile.get('technical_skills', {})}
-        - Education: {user_profile.get('education', [])}
+        Create a compelling professional summary (3-4 sentences) for this candidate and job.
 
         Write a summary that:
         1. Highlights years of experience in relevant field
@@ -122,7 +224,7 @@ class CVTailorAgent:
         Return only the summary text, no additional formatting.
         """
         
-        result = await self.agent.run(summary_prompt)
+        result = await cached_run(self.agent, summary_prompt)
         return result.text.strip()
     
     async def optimize_experience_section(
@@ -132,20 +234,23 @@ class CVTailorAgent:
     ) -> List[Dict]:
         """Optimize work experience descriptions for the specific job."""
         
-        optimized_experience = []
-        
-        for exp in work_experience:
-            optimize_prompt = f"""
-            Reframe this work experience entry to align with job requirements while staying 100% truthful:
+        # Each entry is independent, so fan the LLM calls out concurrently
+        # instead of paying one round-trip per job. The semaphore caps
+        # in-flight requests to stay under provider rate limits.
+        semaphore = asyncio.Semaphore(settings.max_concurrency)
 
+        async def optimize_one(exp: Dict) -> Dict:
+            optimize_prompt = f"""
             JOB REQUIREMENTS:
-            {job_requirements}
+            {fmt_for_prompt(job_requirements)}
+
+            Reframe this work experience entry to align with the job requirements while staying 100% truthful:
 
             ORIGINAL EXPERIENCE:
             Company: {exp.get('company')}
             Position: {exp.get('position')}
             Description: {exp.get('description')}
-            Achievements: {exp.get('achievements', [])}
+            Achievements: {fmt_for_prompt(exp.get('achievements', []))}
 
             Reframe to:
             1. Use keywords ONLY where they genuinely apply to the original experience
@@ -161,26 +266,22 @@ class CVTailorAgent:
                 "achievements": ["original achievement 1", "original achievement 2", ...]
             }}
             """
-            
-            result = await self.agent.run(optimize_prompt)
-            
-            try:
-                import json
-                # Extract JSON from response
-                json_start = result.text.find('{')
-                json_end = result.text.rfind('}') + 1
-                optimized_data = json.loads(result.text[json_start:json_end])
-                
-                # Update experience with optimized content
-                updated_exp = exp.copy()
-                updated_exp.update(optimized_data)
-                optimized_experience.append(updated_exp)
-                
-            except (json.JSONDecodeError, ValueError):
+
+            async with semaphore:
+                result = await cached_run(self.agent, optimize_prompt, response_format={"type": "json_object"})
+
+            optimized_data = parse_llm_json(result.text)
+            if optimized_data is None:
                 # If JSON parsing fails, keep original
-                optimized_experience.append(exp)
-        
-        return optimized_experience
+                return exp
+
+            # Update experience with optimized content
+            updated_exp = exp.copy()
+            updated_exp.update(optimized_data)
+            return updated_exp
+
+        # gather preserves input order, so entries stay chronological.
+        return list(await asyncio.gather(*(optimize_one(exp) for exp in work_experience)))
     
     async def select_relevant_projects(
         self, 
@@ -194,13 +295,13 @@ class CVTailorAgent:
             return []
         
         selection_prompt = f"""
-        Select the {max_projects} most relevant projects from this list for the job requirements:
-
         JOB REQUIREMENTS:
-        {job_requirements}
+        {fmt_for_prompt(job_requirements)}
+
+        Select the {max_projects} most relevant projects from this list for the job requirements:
 
         AVAILABLE PROJECTS:
-        {projects}
+        {fmt_for_prompt(projects)}
 
         Criteria:
         1. Technology stack alignment
@@ -208,20 +309,18 @@ class CVTailorAgent:
         3. Relevance to job responsibilities
         4. Demonstrable impact/results
 
-        Return the selected projects as a JSON array, including any improvements to descriptions to better match the job.
+        Return as a JSON object {{"projects": [...]}} where each entry is a selected project, including any improvements to descriptions to better match the job.
         """
         
-        result = await self.agent.run(selection_prompt)
+        result = await cached_run(self.agent, selection_prompt, response_format={"type": "json_object"})
         
-        try:
-            import json
-            json_start = result.text.find('[')
-            json_end = result.text.rfind(']') + 1
-            selected_projects = json.loads(result.text[json_start:json_end])
-            return selected_projects[:max_projects]
-        except (json.JSONDecodeError, ValueError):
+        # JSON mode requires an object root, so the array arrives wrapped.
+        data = parse_llm_json(result.text)
+        selected_projects = data.get("projects") if isinstance(data, dict) else data
+        if not isinstance(selected_projects, list):
             # Fallback: return first N projects
             return projects[:max_projects]
+        return selected_projects[:max_projects]
     
     async def analyze_profile_gaps(
         self,
@@ -231,13 +330,9 @@ class CVTailorAgent:
         """Analyze gaps between job requirements and candidate profile."""
         
         gap_analysis_prompt = f"""
-        Analyze the gaps between job requirements and candidate profile. Provide specific feedback on what's missing.
+        {self._format_context(user_profile, job_analysis)}
 
-        JOB REQUIREMENTS:
-        {job_analysis}
-
-        CANDIDATE PROFILE:
-        {user_profile}
+        Analyze the gaps between job requirements and candidate profile. Provide specific feedback on what's missing.
 
         Analyze and identify:
         1. Technical skills mentioned in job requirements but not clearly evident in candidate profile
@@ -286,15 +381,10 @@ class CVTailorAgent:
         }}
         """
         
-        result = await self.agent.run(gap_analysis_prompt)
+        result = await cached_run(self.agent, gap_analysis_prompt, response_format={"type": "json_object"})
         
-        try:
-            import json
-            json_start = result.text.find('{')
-            json_end = result.text.rfind('}') + 1
-            gap_analysis = json.loads(result.text[json_start:json_end])
-            return gap_analysis
-        except (json.JSONDecodeError, ValueError):
+        gap_analysis = parse_llm_json(result.text)
+        if gap_analysis is None:
             return {
                 "technical_skills_gaps": [],
                 "experience_gaps": [],
@@ -303,6 +393,7 @@ class CVTailorAgent:
                 "overall_strengths": [],
                 "match_percentage": "Unable to analyze"
             }
+        return gap_analysis
 
     async def generate_skills_section(
         self, 
@@ -312,13 +403,13 @@ class CVTailorAgent:
         """Generate an optimized skills section that matches job requirements."""
         
         skills_prompt = f"""
-        Optimize this skills section for the job requirements:
-
         JOB REQUIREMENTS:
-        {job_requirements}
+        {fmt_for_prompt(job_requirements)}
+
+        Optimize this skills section for the job requirements:
 
         CANDIDATE SKILLS:
-        {user_skills}
+        {fmt_for_prompt(user_skills)}
 
         Create an optimized skills section that:
         1. Prioritizes skills mentioned in job requirements
@@ -337,14 +428,10 @@ class CVTailorAgent:
         }}
         """
         
-        result = await self.agent.run(skills_prompt)
+        result = await cached_run(self.agent, skills_prompt, response_format={"type": "json_object"})
         
-        try:
-            import json
-            json_start = result.text.find('{')
-            json_end = result.text.rfind('}') + 1
-            optimized_skills = json.loads(result.text[json_start:json_end])
-            return optimized_skills
-        except (json.JSONDecodeError, ValueError):
+        optimized_skills = parse_llm_json(result.text)
+        if optimized_skills is None:
             # Fallback: return original skills
-            return user_skills
\ No newline at end of file
+            return user_skills
+        return optimized_skills
\ No newline at end of file
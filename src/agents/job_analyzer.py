@@ -1,22 +1,66 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, ClassVar
+import asyncio
 import re
-import json
-import aiohttp
 from bs4 import BeautifulSoup
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
 from agent_framework import ChatAgent
 from agent_framework.openai import OpenAIChatClient
-from openai import AsyncOpenAI
 from ..utils.config import settings
+from ._client import get_async_openai_client
+from ._cache import cached_run
+from ._json import fmt_for_prompt, parse_llm_json
+from ..utils.http import get_session
+
+# Pre-compiled patterns for _clean_job_text - compiled once at import so
+# each call is a direct C-level match instead of a regex-cache lookup.
+_WHITESPACE_RE = re.compile(r'\s+')
+_COMPANY_RE = re.compile(r'Microsoft.*?hiring\s+(.*?)\s+in\s+(.*?)\s+\|', re.IGNORECASE)
+
+_JOB_START_RES = [
+    re.compile(pattern, re.IGNORECASE | re.DOTALL)
+    for pattern in (
+        r'Overview.*?About The Role',
+        r'About The Role',
+        r'In this role you will',
+        r'Required experience',
+        r'Qualifications',
+        r'We are looking for',
+        r'Job Description',
+    )
+]
+
+# Single alternation so one pass over the text strips all noise patterns
+# instead of one full scan per pattern.
+_ALL_NOISE_RE = re.compile(
+    "|".join(
+        f"(?:{pattern})"
+        for pattern in (
+            r'Sign in.*?Sign in',
+            r'Join to apply.*?Join now',
+            r'LinkedIn.*?User Agreement.*?Cookie Policy',
+            r'Similar jobs.*$',
+            r'People also viewed.*$',
+            r'Show more.*Show less.*$',
+        )
+    ),
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Downstream prompts truncate to ~8K chars anyway, so cap the download:
+# memory stays bounded and huge career pages stop costing bandwidth and
+# parse time past the point of usefulness.
+_MAX_FETCH_BYTES = 256 * 1024
 
 
 class JobAnalyzerAgent:
     """AI agent for analyzing job postings and extracting structured requirements."""
     
     def __init__(self):
-        self.openai_client = AsyncOpenAI(
-            base_url="https://models.github.ai/inference",
-            api_key=settings.github_token,
-        )
+        self.openai_client = get_async_openai_client()
         self.chat_client = OpenAIChatClient(
             async_client=self.openai_client,
             model_id=settings.default_model_id
@@ -24,11 +68,12 @@ class JobAnalyzerAgent:
         self.agent = ChatAgent(
             chat_client=self.chat_client,
             name="JobAnalyzer",
-            instructions=self._get_system_instructions(),
+            instructions=self._SYSTEM_INSTRUCTIONS,
         )
     
-    def _get_system_instructions(self) -> str:
-        return """
+    # Instructions are static, so hold them once on the class instead
+    # of rebuilding the literal through a method call per construction.
+    _SYSTEM_INSTRUCTIONS: ClassVar[str] = """
         You are an expert job posting analyst and ATS specialist. Your task is to extract structured information from job postings.
         
         Focus on identifying:
@@ -44,76 +89,81 @@ class JobAnalyzerAgent:
         Be thorough but concise. Focus on actionable requirements that can be matched against a candidate's profile.
         """
 
+    @classmethod
+    def _get_system_instructions(cls) -> str:
+        return cls._SYSTEM_INSTRUCTIONS
+
     async def fetch_job_content(self, url: str) -> str:
         """Fetch job posting content from URL."""
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                }
-                async with session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        html = await response.text()
-                        soup = BeautifulSoup(html, 'html.parser')
-                        
-                        # Remove script and style elements
-                        for script in soup(["script", "style"]):
-                            script.decompose()
-                        
-                        # Get text and clean up
-                        text = soup.get_text()
-                        lines = (line.strip() for line in text.splitlines())
-                        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-                        text = ' '.join(chunk for chunk in chunks if chunk)
-                        
-                        return text
-                    else:
-                        raise Exception(f"Failed to fetch URL: HTTP {response.status}")
+            # Reuse the shared session so repeated fetches keep their
+            # connections alive instead of re-doing TCP/TLS per call.
+            session = await get_session()
+            headers = {
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            }
+            async with session.get(url, headers=headers) as response:
+                if response.status == 200:
+                    # Stream the body in 64KB chunks so the event loop keeps
+                    # running other work while the download is in flight,
+                    # instead of blocking on one large read.
+                    html = bytearray()
+                    async for chunk in response.content.iter_chunked(64 * 1024):
+                        html.extend(chunk)
+                        if len(html) > _MAX_FETCH_BYTES:
+                            break
+                    return self._extract_text(bytes(html))
+                else:
+                    raise Exception(f"Failed to fetch URL: HTTP {response.status}")
         except Exception as e:
             raise Exception(f"Error fetching job posting: {str(e)}")
 
+    async def fetch_and_clean(self, url: str) -> str:
+        """Fetch a job posting and return its cleaned text in one call."""
+        return self._clean_job_text(await self.fetch_job_content(url))
+
+    @staticmethod
+    def _extract_text(html_bytes: bytes) -> str:
+        """Extract visible text from raw HTML, dropping scripts and styles."""
+        if HTMLParser is not None:
+            # selectolax wraps the Modest engine in C and is an order of
+            # magnitude faster than BeautifulSoup for plain-text extraction.
+            tree = HTMLParser(html_bytes)
+            for tag in tree.css('script, style'):
+                tag.decompose()
+            text = tree.body.text(separator=' ') if tree.body else ''
+        else:
+            soup = BeautifulSoup(html_bytes, 'lxml')
+            for script in soup(["script", "style"]):
+                script.decompose()
+            text = soup.get_text()
+
+        # str.split with no argument collapses whitespace runs and drops
+        # empties in one tight C loop - faster than a regex substitution.
+        return ' '.join(text.split())
+
     def _clean_job_text(self, text: str) -> str:
         """Clean and prepare job text for analysis."""
         # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
+        text = _WHITESPACE_RE.sub(' ', text)
+
         # Extract company and job title from LinkedIn format
         header_info = ""
-        company_match = re.search(r'Microsoft.*?hiring\s+(.*?)\s+in\s+(.*?)\s+\|', text, re.IGNORECASE)
+        company_match = _COMPANY_RE.search(text)
         if company_match:
             header_info = f"Company: Microsoft\\nJob Title: {company_match.group(1)}\\nLocation: {company_match.group(2)}\\n\\n"
-        
+
         # Find the actual job description content
-        job_start_patterns = [
-            r'Overview.*?About The Role',
-            r'About The Role',
-            r'In this role you will', 
-            r'Required experience',
-            r'Qualifications',
-            r'We are looking for',
-            r'Job Description',
-        ]
-        
         job_content = text
-        for pattern in job_start_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        for pattern in _JOB_START_RES:
+            match = pattern.search(text)
             if match:
                 job_content = text[match.start():]
                 break
-        
+
         # Remove LinkedIn noise
-        noise_patterns = [
-            r'Sign in.*?Sign in',
-            r'Join to apply.*?Join now', 
-            r'LinkedIn.*?User Agreement.*?Cookie Policy',
-            r'Similar jobs.*$',
-            r'People also viewed.*$',
-            r'Show more.*Show less.*$',
-        ]
-        
-        for pattern in noise_patterns:
-            job_content = re.sub(pattern, '', job_content, flags=re.IGNORECASE | re.DOTALL)
-        
+        job_content = _ALL_NOISE_RE.sub('', job_content)
+
         return (header_info + job_content.strip()).strip()
 
     async def analyze_job_posting(self, job_url: str = None, job_text: str = None) -> Dict[str, Any]:
@@ -164,23 +214,34 @@ class JobAnalyzerAgent:
         """
         
         # Get analysis from agent
-        result = await self.agent.run(analysis_prompt)
+        result = await cached_run(self.agent, analysis_prompt, response_format={"type": "json_object"})
         
         # Parse the JSON response
-        try:
-            # Extract JSON from the response (in case there's extra text)
-            json_start = result.text.find('{')
-            json_end = result.text.rfind('}') + 1
-            json_str = result.text[json_start:json_end]
-            
-            analysis_data = json.loads(json_str)
-            return analysis_data
-        except (json.JSONDecodeError, ValueError) as e:
+        analysis_data = parse_llm_json(result.text)
+        if analysis_data is None:
             # Fallback: return raw analysis if JSON parsing fails
             return {
                 "raw_analysis": result.text,
-                "error": f"Failed to parse structured analysis: {str(e)}"
+                "error": "Failed to parse structured analysis"
             }
+        return analysis_data
+
+    async def analyze_job_postings(self, urls: List[str], *, concurrency: int = 8) -> List[Any]:
+        """Analyze multiple job posting URLs concurrently.
+
+        Results come back in input order; a failed URL yields its exception
+        in that slot rather than aborting the whole batch.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def analyze_one(url: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.analyze_job_posting(job_url=url)
+
+        return list(await asyncio.gather(
+            *(analyze_one(url) for url in urls),
+            return_exceptions=True
+        ))
 
     async def extract_keywords_for_ats(self, job_analysis: Dict[str, Any]) -> List[str]:
         """Extract keywords optimized for ATS (Applicant Tracking Systems)."""
@@ -189,7 +250,7 @@ class JobAnalyzerAgent:
         Based on this job analysis, generate a list of ATS-optimized keywords that a candidate should include in their CV:
         
         Job Analysis:
-        {job_analysis}
+        {fmt_for_prompt(job_analysis)}
         
         Generate 15-25 keywords that are:
         1. Directly mentioned in the job posting
@@ -201,10 +262,19 @@ class JobAnalyzerAgent:
         Return as a simple comma-separated list.
         """
         
-        result = await self.agent.run(keywords_prompt)
-        
-        # Parse keywords
-        keywords_text = result.text.strip()
-        keywords = [kw.strip() for kw in keywords_text.split(',')]
+        result = await cached_run(self.agent, keywords_prompt)
         
-        return keywords[:25]  # Limit to 25 keywords
\ No newline at end of file
+        # Parse keywords in one pass: dedupe case-insensitively so near-
+        # duplicates don't eat the 25-keyword budget, and stop early
+        # instead of stripping tokens past the cap.
+        seen = set()
+        keywords = []
+        for raw in result.text.strip().split(','):
+            keyword = raw.strip()
+            folded = keyword.lower()
+            if keyword and folded not in seen:
+                seen.add(folded)
+                keywords.append(keyword)
+                if len(keywords) == 25:
+                    break
+        return keywords
\ No newline at end of file
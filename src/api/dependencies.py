@@ -1,3 +1,6 @@
+import hashlib
+
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -6,46 +9,83 @@ from ..database.connection import get_db
 from ..database.repositories.user_repo import UserRepository
 from ..utils.security import verify_token
 
-security = HTTPBearer()
+security = HTTPBearer(auto_error=True)
+
+# Auth runs on every request, and the same client re-sends the same token
+# for many requests in a row. Short TTLs collapse the JWT decode and the
+# user SELECT into dict lookups on the hot path while keeping staleness
+# (e.g. a token cached moments before its expiry) bounded to seconds.
+_token_cache: TTLCache = TTLCache(maxsize=10000, ttl=30)
+_user_cache: TTLCache = TTLCache(maxsize=5000, ttl=60)
+
+
+def _token_hash(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()[:32]
+
+
+def invalidate_token_cache(token: str) -> None:
+    """Drop cached auth state for a token (called from logout)."""
+    email = _token_cache.pop(_token_hash(token), None)
+    if email is not None:
+        _user_cache.pop(email, None)
+
+
+async def get_verified_email(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> str:
+    """Verify the bearer token and return its subject email.
+
+    Depends only on the credentials, so routes resolve it before get_db -
+    a rejected token never pays for acquiring a database session.
+    """
+    token = credentials.credentials
+    token_hash = _token_hash(token)
+
+    email = _token_cache.get(token_hash)
+    if email is None:
+        payload = verify_token(token)
+        email = payload.get("sub")
+
+        if email is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid authentication credentials",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        _token_cache[token_hash] = email
+
+    return email
 
 
 async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    email: str = Depends(get_verified_email),
     db: AsyncSession = Depends(get_db)
 ):
     """Dependency to get current authenticated user."""
-    
-    # Verify token
-    payload = verify_token(credentials.credentials)
-    email: str = payload.get("sub")
-    
-    if email is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    # Get user from database
-    user_repo = UserRepository(db)
-    user = await user_repo.get_user_by_email(email)
-    
+
+    # Get user from database (cached by email)
+    user = _user_cache.get(email)
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
+        user_repo = UserRepository(db)
+        user = await user_repo.get_user_by_email(email)
+
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        _user_cache[email] = user
+
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Inactive user"
         )
-    
+
     return user
 
 
 async def get_user_repository(db: AsyncSession = Depends(get_db)) -> UserRepository:
     """Dependency to get user repository."""
-    return UserRepository(db)
\ No newline at end of file
+    return UserRepository(db)
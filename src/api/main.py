@@ -1,6 +1,6 @@
 from fastapi import FastAPI, Depends, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.security import HTTPBearer
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 import uvicorn
 
@@ -29,6 +29,7 @@ app = FastAPI(
     title=settings.app_name,
     version=settings.version,
     description="AI-powered CV and bio generation tailored to specific job requirements",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -41,8 +42,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Security
-security = HTTPBearer()
+# Security: single shared HTTPBearer from dependencies
+# (a second instance here only duplicated its OpenAPI scheme metadata)
 
 # Include routers
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
@@ -86,5 +87,7 @@ if __name__ == "__main__":
         "src.api.main:app",
         host="0.0.0.0",
         port=8000,
+        loop="auto",  # picks uvloop when installed
+        http="httptools",
         reload=settings.debug
     )
\ No newline at end of file
@@ -1,13 +1,14 @@
 from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...database.connection import get_db
 from ...database.repositories.user_repo import UserRepository
 from ...schemas.models import UserCreate, UserLogin, Token, UserResponse
-from ...utils.security import create_access_token, verify_password
+from ...utils.security import create_access_token
 from ...utils.config import settings
-from ..dependencies import get_current_user
+from ..dependencies import get_current_user, invalidate_token_cache, security
 
 router = APIRouter()
 
@@ -76,8 +77,11 @@ async def login(
 
 
 @router.post("/logout")
-async def logout():
+async def logout(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """Logout user (client should remove token)."""
+    # Drop cached auth state so the token stops working immediately
+    # instead of lingering until the cache TTL expires.
+    invalidate_token_cache(credentials.credentials)
     return {"message": "Successfully logged out"}
 
 
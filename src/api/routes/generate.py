@@ -1,20 +1,75 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, Response
-from fastapi.responses import StreamingResponse
+import asyncio
+from datetime import datetime
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Response
+from sqlalchemy import delete, insert, lambda_stmt, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-import io
-import json
+import re
+
+import orjson
 
 from ...database.connection import get_db
+from ...utils.config import settings
 from ...database.models import JobAnalysis, UserProfile, GeneratedContent
-from ...schemas.models import ContentGenerateRequest, ContentResponse
+from ...schemas.models import ContentGenerateRequest, ContentResponse, ContentSummary
 from ...agents.cv_tailor import CVTailorAgent
 from ...agents.bio_generator import BioGeneratorAgent
 from ..dependencies import get_current_user
 
 router = APIRouter()
 
+# Compiled once; stripping markdown per export no longer recompiles the
+# pattern or pays the regex-cache lookup.
+_MD_STRIP = re.compile(r'[*_#`]')
+
+# The agents are stateless wrappers over a shared chat client; building
+# them per request re-ran ChatAgent setup on the hot path. One instance
+# of each serves every request.
+_CV_AGENT = CVTailorAgent()
+_BIO_AGENT = BioGeneratorAgent()
+
+# Bounded LLM concurrency: beyond the cap we shed load with a 503 rather
+# than queueing, which keeps tail latency flat during spikes, and a
+# deadline keeps a wedged upstream call from pinning a slot.
+_LLM_SEM = asyncio.Semaphore(settings.llm_concurrency)
+
+_LLM_BUSY = HTTPException(
+    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+    detail="Generation capacity is saturated; retry shortly",
+    headers={"Retry-After": "5"},
+)
+
+# Bio generation variants by requested context. Each entry takes the
+# shared agent, the profile data and the incoming request.
+_BIO_DISPATCH = {
+    "presentation": lambda agent, profile, request: agent.generate_presentation_bio(
+        user_profile=profile,
+        presentation_topic=request.additional_instructions,
+        audience="professional",
+    ),
+    "linkedin": lambda agent, profile, request: agent.generate_linkedin_summary(
+        user_profile=profile,
+    ),
+    "executive": lambda agent, profile, request: agent.generate_executive_summary(
+        user_profile=profile,
+        executive_level="senior",
+    ),
+    "elevator": lambda agent, profile, request: agent.generate_elevator_pitch(
+        user_profile=profile,
+    ),
+}
+
+
+def _content_stmt(content_id: int, user_id: int):
+    """Owned-content lookup; lambda_stmt caches the expression-tree build."""
+    return lambda_stmt(
+        lambda: select(GeneratedContent).where(
+            GeneratedContent.id == content_id,
+            GeneratedContent.user_id == user_id,
+        )
+    )
+
 
 @router.post("/cv", response_model=ContentResponse)
 async def generate_tailored_cv(
@@ -24,62 +79,77 @@ async def generate_tailored_cv(
 ):
     """Generate a tailored CV based on job analysis and user profile."""
     
-    # Get job analysis
-    job_result = await db.execute(
-        select(JobAnalysis)
-        .where(JobAnalysis.id == request.job_analysis_id)
-        .where(JobAnalysis.user_id == current_user.id)
-    )
-    job_analysis = job_result.scalar_one_or_none()
-    
-    if not job_analysis:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Job analysis not found"
+    # Fetch the job analysis and the active profile in one round-trip
+    result = await db.execute(
+        select(JobAnalysis, UserProfile)
+        .join(UserProfile, UserProfile.user_id == JobAnalysis.user_id)
+        .where(
+            JobAnalysis.id == request.job_analysis_id,
+            JobAnalysis.user_id == current_user.id,
+            UserProfile.is_active == True,
         )
-    
-    # Get user profile
-    profile_result = await db.execute(
-        select(UserProfile)
-        .where(UserProfile.user_id == current_user.id)
-        .where(UserProfile.is_active == True)
+        .limit(1)
     )
-    user_profile = profile_result.scalar_one_or_none()
-    
-    if not user_profile:
+    row = result.one_or_none()
+
+    if row is None:
+        # Joined lookup failed; one extra query on this error path tells
+        # the caller which half was missing.
+        job_result = await db.execute(
+            select(JobAnalysis.id)
+            .where(
+                JobAnalysis.id == request.job_analysis_id,
+                JobAnalysis.user_id == current_user.id,
+            )
+            .limit(1)
+        )
+        if job_result.scalar() is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Job analysis not found"
+            )
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User profile not found. Please create a profile first."
         )
+
+    job_analysis, user_profile = row
     
-    # Generate CV using AI agent
-    cv_agent = CVTailorAgent()
+    # Generate CV using the shared AI agent
+    if _LLM_SEM.locked():
+        raise _LLM_BUSY
     
     try:
-        cv_content = await cv_agent.generate_tailored_cv(
-            user_profile=user_profile.profile_data,
-            job_analysis=job_analysis.analysis_data,
-            style=request.style or "professional",
-            format_type=request.template or "ats_optimized"
-        )
+        async with _LLM_SEM:
+            cv_content = await asyncio.wait_for(
+                _CV_AGENT.generate_tailored_cv(
+                    user_profile=user_profile.profile_data,
+                    job_analysis=job_analysis.analysis_data,
+                    style=request.style or "professional",
+                    format_type=request.template or "ats_optimized"
+                ),
+                timeout=settings.llm_timeout_seconds,
+            )
         
-        # Store generated content
-        generated_content = GeneratedContent(
-            user_id=current_user.id,
-            job_analysis_id=request.job_analysis_id,
-            content_type="cv",
-            content=cv_content,
-            format=request.format,
-            metadata={
-                "style": request.style,
-                "template": request.template,
-                "additional_instructions": request.additional_instructions
-            }
+        # Store generated content; RETURNING skips the refresh round-trip
+        inserted = await db.execute(
+            insert(GeneratedContent)
+            .values(
+                user_id=current_user.id,
+                job_analysis_id=request.job_analysis_id,
+                content_type="cv",
+                content=cv_content,
+                format=request.format,
+                content_metadata={
+                    "style": request.style,
+                    "template": request.template,
+                    "additional_instructions": request.additional_instructions
+                },
+            )
+            .returning(GeneratedContent)
         )
-        
-        db.add(generated_content)
+        generated_content = inserted.scalar_one()
         await db.commit()
-        await db.refresh(generated_content)
         
         return generated_content
         
@@ -101,82 +171,73 @@ async def generate_professional_bio(
 ):
     """Generate a professional bio for presentations or profiles."""
     
-    # Get user profile
-    profile_result = await db.execute(
-        select(UserProfile)
-        .where(UserProfile.user_id == current_user.id)
-        .where(UserProfile.is_active == True)
+    # Get user profile, and the job context (when requested) in the same
+    # round-trip via an outer join so a missing analysis is not an error.
+    profile_stmt = (
+        select(UserProfile, JobAnalysis)
+        .outerjoin(
+            JobAnalysis,
+            (JobAnalysis.id == (request.job_analysis_id or 0))
+            & (JobAnalysis.user_id == UserProfile.user_id)
+        )
+        .where(
+            UserProfile.user_id == current_user.id,
+            UserProfile.is_active == True,
+        )
+        .limit(1)
     )
-    user_profile = profile_result.scalar_one_or_none()
-    
-    if not user_profile:
+    row = (await db.execute(profile_stmt)).one_or_none()
+
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User profile not found. Please create a profile first."
         )
+
+    user_profile, job_analysis = row
+    job_context = job_analysis.analysis_data if job_analysis else None
     
-    # Get job context if provided
-    job_context = None
-    if request.job_analysis_id:
-        job_result = await db.execute(
-            select(JobAnalysis)
-            .where(JobAnalysis.id == request.job_analysis_id)
-            .where(JobAnalysis.user_id == current_user.id)
-        )
-        job_analysis = job_result.scalar_one_or_none()
-        if job_analysis:
-            job_context = job_analysis.analysis_data
-    
-    # Generate bio using AI agent
-    bio_agent = BioGeneratorAgent()
+    # Generate bio using the shared AI agent
+    if _LLM_SEM.locked():
+        raise _LLM_BUSY
     
     try:
-        if context == "presentation":
-            bio_content = await bio_agent.generate_presentation_bio(
-                user_profile=user_profile.profile_data,
-                presentation_topic=request.additional_instructions,
-                audience="professional"
-            )
-        elif context == "linkedin":
-            bio_content = await bio_agent.generate_linkedin_summary(
-                user_profile=user_profile.profile_data
-            )
-        elif context == "executive":
-            bio_content = await bio_agent.generate_executive_summary(
-                user_profile=user_profile.profile_data,
-                executive_level="senior"
-            )
-        elif context == "elevator":
-            bio_content = await bio_agent.generate_elevator_pitch(
-                user_profile=user_profile.profile_data
-            )
-        else:
-            bio_content = await bio_agent.generate_professional_bio(
-                user_profile=user_profile.profile_data,
-                job_context=job_context,
-                length=length,
-                style=bio_style,
-                context=context
+        handler = _BIO_DISPATCH.get(context)
+        async with _LLM_SEM:
+            if handler is not None:
+                coro = handler(_BIO_AGENT, user_profile.profile_data, request)
+            else:
+                coro = _BIO_AGENT.generate_professional_bio(
+                    user_profile=user_profile.profile_data,
+                    job_context=job_context,
+                    length=length,
+                    style=bio_style,
+                    context=context
+                )
+            bio_content = await asyncio.wait_for(
+                coro, timeout=settings.llm_timeout_seconds
             )
         
-        # Store generated content
-        generated_content = GeneratedContent(
-            user_id=current_user.id,
-            job_analysis_id=request.job_analysis_id,
-            content_type="bio",
-            content=bio_content,
-            format=request.format,
-            metadata={
-                "length": length,
-                "style": bio_style,
-                "context": context,
-                "additional_instructions": request.additional_instructions
-            }
+        # Store generated content; RETURNING skips the refresh round-trip
+        inserted = await db.execute(
+            insert(GeneratedContent)
+            .values(
+                user_id=current_user.id,
+                job_analysis_id=request.job_analysis_id,
+                content_type="bio",
+                content=bio_content,
+                format=request.format,
+                content_metadata={
+                    "length": length,
+                    "style": bio_style,
+                    "context": context,
+                    "additional_instructions": request.additional_instructions
+                },
+            )
+            .returning(GeneratedContent)
         )
-        
-        db.add(generated_content)
+        generated_content = inserted.scalar_one()
         await db.commit()
-        await db.refresh(generated_content)
         
         return generated_content
         
@@ -187,25 +248,65 @@ async def generate_professional_bio(
         )
 
 
-@router.get("/history", response_model=List[ContentResponse])
+@router.get("/history", response_model=List[ContentSummary])
 async def get_generation_history(
+    response: Response,
     current_user = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
     content_type: str = None,
     limit: int = 50,
-    offset: int = 0
+    before: Optional[str] = None
 ):
-    """Get user's content generation history."""
-    
-    query = select(GeneratedContent).where(GeneratedContent.user_id == current_user.id)
+    """Get user's content generation history.
+
+    Paginates by keyset: pass the X-Next-Before header value back as
+    ``before`` to fetch the next page. Unlike OFFSET, the cost of a page
+    does not grow with how deep into the history it is. The cursor is
+    ``created_at:id`` - rows can share a timestamp (batch inserts, or
+    Postgres' transaction-scoped now()), so the tiebreaker id must be
+    part of the comparison or boundary rows are skipped between pages.
+    """
+    
+    # History rows never render the content body, so fetch only the
+    # summary columns rather than hydrating whole rows.
+    query = select(
+        GeneratedContent.id,
+        GeneratedContent.user_id,
+        GeneratedContent.job_analysis_id,
+        GeneratedContent.content_type,
+        GeneratedContent.format,
+        GeneratedContent.created_at,
+    ).where(GeneratedContent.user_id == current_user.id)
     
     if content_type:
         query = query.where(GeneratedContent.content_type == content_type)
     
-    query = query.order_by(GeneratedContent.created_at.desc()).offset(offset).limit(limit)
-    
+    if before is not None:
+        ts_part, _, id_part = before.rpartition(":")
+        try:
+            before_ts = datetime.fromisoformat(ts_part)
+            before_id = int(id_part)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid 'before' cursor; pass the X-Next-Before header value"
+            )
+        # Row-value comparison matches the (created_at, id) sort order
+        query = query.where(
+            tuple_(GeneratedContent.created_at, GeneratedContent.id)
+            < (before_ts, before_id)
+        )
+
+    query = query.order_by(
+        GeneratedContent.created_at.desc(), GeneratedContent.id.desc()
+    ).limit(limit)
+
     result = await db.execute(query)
-    content_list = result.scalars().all()
+    content_list = result.all()
+
+    if len(content_list) == limit:
+        last = content_list[-1]
+        response.headers["X-Next-Before"] = f"{last.created_at.isoformat()}:{last.id}"
     
     return content_list
 
@@ -213,16 +314,14 @@ async def get_generation_history(
 @router.get("/{content_id}", response_model=ContentResponse)
 async def get_generated_content(
     content_id: int,
+    request: Request,
+    response: Response,
     current_user = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Get specific generated content by ID."""
     
-    result = await db.execute(
-        select(GeneratedContent)
-        .where(GeneratedContent.id == content_id)
-        .where(GeneratedContent.user_id == current_user.id)
-    )
+    result = await db.execute(_content_stmt(content_id, current_user.id))
     
     content = result.scalar_one_or_none()
     
@@ -232,6 +331,14 @@ async def get_generated_content(
             detail="Generated content not found"
         )
     
+    # Generated content never changes after creation, so a weak ETag of
+    # (id, created_at) lets repeat readers skip the payload entirely.
+    etag = f'W/"{content.id}-{int(content.created_at.timestamp())}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, max-age=31536000, immutable"
+    
     return content
 
 
@@ -245,11 +352,7 @@ async def export_content(
     """Export generated content in various formats."""
     
     # Get content
-    result = await db.execute(
-        select(GeneratedContent)
-        .where(GeneratedContent.id == content_id)
-        .where(GeneratedContent.user_id == current_user.id)
-    )
+    result = await db.execute(_content_stmt(content_id, current_user.id))
     
     content = result.scalar_one_or_none()
     
@@ -263,8 +366,9 @@ async def export_content(
     filename = f"{content.content_type}_{content_id}"
     
     if export_format == "markdown" or export_format == "md":
+        # Hand bytes to Response so FastAPI skips its str-to-bytes pass.
         return Response(
-            content=content.content,
+            content=content.content.encode(),
             media_type="text/markdown",
             headers={
                 "Content-Disposition": f"attachment; filename={filename}.md"
@@ -273,10 +377,9 @@ async def export_content(
     
     elif export_format == "txt":
         # Strip markdown formatting for plain text
-        import re
-        plain_text = re.sub(r'[*_#`]', '', content.content)
+        plain_text = _MD_STRIP.sub('', content.content)
         return Response(
-            content=plain_text,
+            content=plain_text.encode(),
             media_type="text/plain",
             headers={
                 "Content-Disposition": f"attachment; filename={filename}.txt"
@@ -289,11 +392,12 @@ async def export_content(
             "content_type": content.content_type,
             "content": content.content,
             "format": content.format,
-            "metadata": content.metadata,
-            "created_at": content.created_at.isoformat()
+            "metadata": content.content_metadata,
+            # orjson serializes datetime natively; no isoformat() string pass
+            "created_at": content.created_at
         }
         return Response(
-            content=json.dumps(export_data, indent=2),
+            content=orjson.dumps(export_data, option=orjson.OPT_INDENT_2),
             media_type="application/json",
             headers={
                 "Content-Disposition": f"attachment; filename={filename}.json"
@@ -307,7 +411,7 @@ async def export_content(
         )
 
 
-@router.delete("/{content_id}")
+@router.delete("/{content_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_generated_content(
     content_id: int,
     current_user = Depends(get_current_user),
@@ -315,21 +419,20 @@ async def delete_generated_content(
 ):
     """Delete generated content."""
     
+    # One DELETE ... WHERE; rowcount says whether the row existed, so
+    # there is no need to SELECT and hydrate it first.
     result = await db.execute(
-        select(GeneratedContent)
-        .where(GeneratedContent.id == content_id)
-        .where(GeneratedContent.user_id == current_user.id)
+        delete(GeneratedContent).where(
+            GeneratedContent.id == content_id,
+            GeneratedContent.user_id == current_user.id,
+        )
     )
+    await db.commit()
     
-    content = result.scalar_one_or_none()
-    
-    if not content:
+    if result.rowcount == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Generated content not found"
         )
     
-    await db.delete(content)
-    await db.commit()
-    
-    return {"message": "Generated content deleted successfully"}
\ No newline at end of file
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
\ No newline at end of file
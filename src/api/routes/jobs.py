@@ -1,17 +1,29 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...database.connection import get_db
 from ...database.models import JobAnalysis
-from ...schemas.models import JobAnalysisCreate, JobAnalysisResponse
+from ...schemas.models import JobAnalysisCreate, JobAnalysisResponse, JobAnalysisSummary
 from ...agents.job_analyzer import JobAnalyzerAgent
 from ..dependencies import get_current_user
+from sqlalchemy import delete, insert, lambda_stmt, tuple_
 from sqlalchemy.future import select
 
 router = APIRouter()
 
 
+def _analysis_stmt(analysis_id: int, user_id: int):
+    """Owned-analysis lookup; lambda_stmt caches the expression-tree build."""
+    return lambda_stmt(
+        lambda: select(JobAnalysis).where(
+            JobAnalysis.id == analysis_id,
+            JobAnalysis.user_id == user_id,
+        )
+    )
+
+
 @router.post("/analyze", response_model=JobAnalysisResponse)
 async def analyze_job_posting(
     job_data: JobAnalysisCreate,
@@ -34,18 +46,21 @@ async def analyze_job_posting(
         job_title = job_data.job_title or analysis_result.get('job_title', 'Unknown Position')
         company_name = job_data.company_name or analysis_result.get('company_name', 'Unknown Company')
         
-        # Store analysis in database
-        job_analysis = JobAnalysis(
-            user_id=current_user.id,
-            job_url=job_data.job_url,
-            job_title=job_title,
-            company_name=company_name,
-            analysis_data=analysis_result
+        # Store analysis in database; RETURNING brings back the row with
+        # its server defaults, so no refresh round-trip is needed
+        inserted = await db.execute(
+            insert(JobAnalysis)
+            .values(
+                user_id=current_user.id,
+                job_url=job_data.job_url,
+                job_title=job_title,
+                company_name=company_name,
+                analysis_data=analysis_result,
+            )
+            .returning(JobAnalysis)
         )
-        
-        db.add(job_analysis)
+        job_analysis = inserted.scalar_one()
         await db.commit()
-        await db.refresh(job_analysis)
         
         return job_analysis
         
@@ -56,40 +71,73 @@ async def analyze_job_posting(
         )
 
 
-@router.get("/history", response_model=List[JobAnalysisResponse])
+@router.get("/history", response_model=List[JobAnalysisSummary])
 async def get_job_analysis_history(
+    response: Response,
     current_user = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
     limit: int = 50,
-    offset: int = 0
+    before: Optional[str] = None
 ):
-    """Get user's job analysis history."""
-    
-    result = await db.execute(
-        select(JobAnalysis)
+    """Get user's job analysis history.
+
+    Paginates by keyset: pass the X-Next-Before header value back as
+    ``before`` to fetch the next page. The cursor is ``created_at:id``
+    so rows sharing the boundary timestamp are not skipped between pages.
+    """
+    
+    # History rows never render analysis_data, so fetch only the
+    # summary columns rather than hydrating whole rows.
+    query = (
+        select(
+            JobAnalysis.id,
+            JobAnalysis.user_id,
+            JobAnalysis.job_url,
+            JobAnalysis.job_title,
+            JobAnalysis.company_name,
+            JobAnalysis.created_at,
+        )
         .where(JobAnalysis.user_id == current_user.id)
-        .order_by(JobAnalysis.created_at.desc())
-        .offset(offset)
+        .order_by(JobAnalysis.created_at.desc(), JobAnalysis.id.desc())
         .limit(limit)
     )
+    if before is not None:
+        ts_part, _, id_part = before.rpartition(":")
+        try:
+            before_ts = datetime.fromisoformat(ts_part)
+            before_id = int(id_part)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid 'before' cursor; pass the X-Next-Before header value"
+            )
+        # Row-value comparison matches the (created_at, id) sort order
+        query = query.where(
+            tuple_(JobAnalysis.created_at, JobAnalysis.id)
+            < (before_ts, before_id)
+        )
+
+    result = await db.execute(query)
+    analyses = result.all()
+
+    if len(analyses) == limit:
+        last = analyses[-1]
+        response.headers["X-Next-Before"] = f"{last.created_at.isoformat()}:{last.id}"
     
-    analyses = result.scalars().all()
     return analyses
 
 
 @router.get("/{analysis_id}", response_model=JobAnalysisResponse)
 async def get_job_analysis(
     analysis_id: int,
+    request: Request,
+    response: Response,
     current_user = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Get specific job analysis by ID."""
     
-    result = await db.execute(
-        select(JobAnalysis)
-        .where(JobAnalysis.id == analysis_id)
-        .where(JobAnalysis.user_id == current_user.id)
-    )
+    result = await db.execute(_analysis_stmt(analysis_id, current_user.id))
     
     analysis = result.scalar_one_or_none()
     
@@ -99,10 +147,18 @@ async def get_job_analysis(
             detail="Job analysis not found"
         )
     
+    # Analyses are immutable once stored, so a weak ETag of
+    # (id, created_at) lets repeat readers skip the payload entirely.
+    etag = f'W/"{analysis.id}-{int(analysis.created_at.timestamp())}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, max-age=31536000, immutable"
+    
     return analysis
 
 
-@router.delete("/{analysis_id}")
+@router.delete("/{analysis_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_job_analysis(
     analysis_id: int,
     current_user = Depends(get_current_user),
@@ -110,24 +166,23 @@ async def delete_job_analysis(
 ):
     """Delete a job analysis."""
     
+    # One DELETE ... WHERE; rowcount says whether the row existed, so
+    # there is no need to SELECT and hydrate it first.
     result = await db.execute(
-        select(JobAnalysis)
-        .where(JobAnalysis.id == analysis_id)
-        .where(JobAnalysis.user_id == current_user.id)
+        delete(JobAnalysis).where(
+            JobAnalysis.id == analysis_id,
+            JobAnalysis.user_id == current_user.id,
+        )
     )
+    await db.commit()
     
-    analysis = result.scalar_one_or_none()
-    
-    if not analysis:
+    if result.rowcount == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Job analysis not found"
         )
     
-    await db.delete(analysis)
-    await db.commit()
-    
-    return {"message": "Job analysis deleted successfully"}
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
 @router.get("/{analysis_id}/keywords")
@@ -139,11 +194,7 @@ async def get_ats_keywords(
     """Get ATS-optimized keywords for a specific job analysis."""
     
     # Get job analysis
-    result = await db.execute(
-        select(JobAnalysis)
-        .where(JobAnalysis.id == analysis_id)
-        .where(JobAnalysis.user_id == current_user.id)
-    )
+    result = await db.execute(_analysis_stmt(analysis_id, current_user.id))
     
     analysis = result.scalar_one_or_none()
     
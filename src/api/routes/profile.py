@@ -1,5 +1,6 @@
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import insert, lambda_stmt, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
@@ -16,6 +17,51 @@ from ..dependencies import get_current_user
 router = APIRouter()
 
 
+def _active_profile_stmt(user_id: int):
+    """Active-profile lookup; lambda_stmt caches the expression-tree build.
+
+    The unique partial index guarantees at most one active row per user,
+    so no ordering is needed.
+    """
+    return lambda_stmt(
+        lambda: select(UserProfile)
+        .where(UserProfile.user_id == user_id, UserProfile.is_active == True)
+        .limit(1)
+    )
+
+
+async def _replace_active_profile(
+    db: AsyncSession, user_id: int, profile_data: dict
+) -> UserProfile:
+    """Deactivate the current profile and insert the next version.
+
+    One UPDATE ... RETURNING plus one INSERT ... RETURNING in the same
+    transaction: two round-trips instead of SELECT/mutate/refresh, and no
+    window where a concurrent writer can leave two active rows.
+    """
+    deactivated = await db.execute(
+        update(UserProfile)
+        .where(UserProfile.user_id == user_id, UserProfile.is_active == True)
+        .values(is_active=False)
+        .returning(UserProfile.version)
+    )
+    next_version = (deactivated.scalar() or 0) + 1
+
+    inserted = await db.execute(
+        insert(UserProfile)
+        .values(
+            user_id=user_id,
+            profile_data=profile_data,
+            version=next_version,
+            is_active=True,
+        )
+        .returning(UserProfile)
+    )
+    new_profile = inserted.scalar_one()
+    await db.commit()
+    return new_profile
+
+
 @router.get("/", response_model=UserProfileResponse)
 async def get_user_profile(
     current_user = Depends(get_current_user),
@@ -23,12 +69,7 @@ async def get_user_profile(
 ):
     """Get current user's active profile."""
     
-    result = await db.execute(
-        select(UserProfile)
-        .where(UserProfile.user_id == current_user.id)
-        .where(UserProfile.is_active == True)
-        .order_by(UserProfile.version.desc())
-    )
+    result = await db.execute(_active_profile_stmt(current_user.id))
     
     profile = result.scalar_one_or_none()
     
@@ -56,11 +97,7 @@ async def create_user_profile(
     """Create a new user profile."""
     
     # Check if user already has an active profile
-    result = await db.execute(
-        select(UserProfile)
-        .where(UserProfile.user_id == current_user.id)
-        .where(UserProfile.is_active == True)
-    )
+    result = await db.execute(_active_profile_stmt(current_user.id))
     
     existing_profile = result.scalar_one_or_none()
     
@@ -70,17 +107,19 @@ async def create_user_profile(
             detail="User already has an active profile. Use PUT to update."
         )
     
-    # Create new profile
-    new_profile = UserProfile(
-        user_id=current_user.id,
-        profile_data=profile_data.profile_data.dict(),
-        version=1,
-        is_active=True
+    # Create new profile; RETURNING skips the refresh round-trip
+    inserted = await db.execute(
+        insert(UserProfile)
+        .values(
+            user_id=current_user.id,
+            profile_data=profile_data.profile_data.model_dump(),
+            version=1,
+            is_active=True,
+        )
+        .returning(UserProfile)
     )
-    
-    db.add(new_profile)
+    new_profile = inserted.scalar_one()
     await db.commit()
-    await db.refresh(new_profile)
     
     return new_profile
 
@@ -93,35 +132,9 @@ async def update_user_profile(
 ):
     """Update user's profile (creates new version)."""
     
-    # Get current active profile
-    result = await db.execute(
-        select(UserProfile)
-        .where(UserProfile.user_id == current_user.id)
-        .where(UserProfile.is_active == True)
+    return await _replace_active_profile(
+        db, current_user.id, profile_update.profile_data.model_dump()
     )
-    
-    current_profile = result.scalar_one_or_none()
-    
-    # Deactivate current profile if it exists
-    if current_profile:
-        current_profile.is_active = False
-        next_version = current_profile.version + 1
-    else:
-        next_version = 1
-    
-    # Create new profile version
-    new_profile = UserProfile(
-        user_id=current_user.id,
-        profile_data=profile_update.profile_data.dict(),
-        version=next_version,
-        is_active=True
-    )
-    
-    db.add(new_profile)
-    await db.commit()
-    await db.refresh(new_profile)
-    
-    return new_profile
 
 
 @router.get("/history", response_model=List[UserProfileResponse])
@@ -154,8 +167,7 @@ async def revert_to_profile_version(
     # Find the target version
     result = await db.execute(
         select(UserProfile)
-        .where(UserProfile.user_id == current_user.id)
-        .where(UserProfile.version == version)
+        .where(UserProfile.user_id == current_user.id, UserProfile.version == version)
     )
     
     target_profile = result.scalar_one_or_none()
@@ -166,34 +178,15 @@ async def revert_to_profile_version(
             detail=f"Profile version {version} not found"
         )
     
-    # Deactivate current active profile
-    current_result = await db.execute(
-        select(UserProfile)
-        .where(UserProfile.user_id == current_user.id)
-        .where(UserProfile.is_active == True)
+    # Deactivate the current active profile and insert the reverted data
+    # as the next version in one transaction
+    reverted_profile = await _replace_active_profile(
+        db, current_user.id, target_profile.profile_data
     )
     
-    current_profile = current_result.scalar_one_or_none()
-    if current_profile:
-        current_profile.is_active = False
-    
-    # Create new profile with reverted data
-    new_version = (current_profile.version + 1) if current_profile else 1
-    
-    reverted_profile = UserProfile(
-        user_id=current_user.id,
-        profile_data=target_profile.profile_data,
-        version=new_version,
-        is_active=True
-    )
-    
-    db.add(reverted_profile)
-    await db.commit()
-    await db.refresh(reverted_profile)
-    
     return {
         "message": f"Successfully reverted to version {version}",
-        "new_version": new_version
+        "new_version": reverted_profile.version
     }
 
 
@@ -212,35 +205,14 @@ async def import_profile_data(
         
         profile_data = UserProfileData(**import_data)
         
-        # Create or update profile
-        result = await db.execute(
-            select(UserProfile)
-            .where(UserProfile.user_id == current_user.id)
-            .where(UserProfile.is_active == True)
-        )
-        
-        current_profile = result.scalar_one_or_none()
-        
-        if current_profile:
-            current_profile.is_active = False
-            next_version = current_profile.version + 1
-        else:
-            next_version = 1
-        
-        new_profile = UserProfile(
-            user_id=current_user.id,
-            profile_data=profile_data.dict(),
-            version=next_version,
-            is_active=True
+        # Create or replace the active profile
+        new_profile = await _replace_active_profile(
+            db, current_user.id, profile_data.model_dump()
         )
         
-        db.add(new_profile)
-        await db.commit()
-        await db.refresh(new_profile)
-        
         return {
             "message": "Profile data imported successfully",
-            "version": next_version
+            "version": new_profile.version
         }
         
     except Exception as e:
@@ -1,36 +1,78 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 from ..utils.config import settings
 
+# Pool tuning applies to client/server databases (Postgres in
+# production): LIFO reuse keeps hot connections cache-warm while idle
+# ones age out, and pre-ping drops stale connections before a request
+# trips over them. SQLite is a local file, so pooling buys nothing there
+# and NullPool keeps its connection handling trivial.
+if settings.database_url.startswith("sqlite"):
+    _pool_kwargs = dict(poolclass=NullPool)
+else:
+    _pool_kwargs = dict(
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=30,
+        pool_recycle=1800,
+        pool_pre_ping=True,
+        pool_use_lifo=True,
+    )
+
 # Create async engine
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,  # Log SQL queries in debug mode
-    future=True
+    future=True,
+    **_pool_kwargs
 )
 
-# Create async session factory
-async_session_factory = sessionmaker(
-    engine, class_=AsyncSession, expire_on_commit=False
-)
+# Create async session factory (async_sessionmaker skips the sync
+# compatibility shim that sessionmaker(class_=AsyncSession) goes through)
+async_session_factory = async_sessionmaker(engine, expire_on_commit=False)
 
-# Base class for all models
-Base = declarative_base()
+
+class Base(DeclarativeBase):
+    """Base class for all models."""
 
 
 async def get_db():
-    """Dependency to get database session."""
+    """Dependency yielding a session with request-scoped transaction.
+
+    Commits once when the handler succeeds and rolls back on any
+    exception; the context manager handles closing, so no explicit
+    close call is needed.
+    """
     async with async_session_factory() as session:
         try:
             yield session
-        finally:
-            await session.close()
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
 
 
 async def init_db():
     """Initialize database - create all tables."""
+    from ..utils.config import ensure_output_dirs
+    ensure_output_dirs()
     async with engine.begin() as conn:
         # Import all models here to ensure they're registered
         from . import models
-        await conn.run_sync(Base.metadata.create_all)
\ No newline at end of file
+        await conn.run_sync(Base.metadata.create_all)
+        
+        # GIN indexes make containment/path queries on the JSON documents
+        # index probes; the syntax is PostgreSQL-only, so they are issued
+        # outside create_all and skipped on SQLite.
+        if engine.dialect.name == "postgresql":
+            from sqlalchemy import text
+            await conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_user_profiles_profile_data_gin "
+                "ON user_profiles USING gin (profile_data)"
+            ))
+            await conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_job_analyses_analysis_data_gin "
+                "ON job_analyses USING gin (analysis_data)"
+            ))
\ No newline at end of file
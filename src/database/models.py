@@ -1,8 +1,13 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Index, JSON
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from .connection import Base
 
+# jsonb on PostgreSQL (binary storage, indexable, no per-row re-parse);
+# plain JSON everywhere else.
+_JSON_DOC = JSONB().with_variant(JSON(), "sqlite")
+
 
 class User(Base):
     """User model for authentication and profile management."""
@@ -26,10 +31,22 @@ class User(Base):
 class UserProfile(Base):
     """User profile containing all professional information."""
     __tablename__ = "user_profiles"
-    
+    # Every request that needs the profile filters on (user_id, is_active);
+    # the partial index keeps only active rows, so the lookup is one probe.
+    # Unique so the database itself rejects two active versions per user.
+    __table_args__ = (
+        Index(
+            "ix_user_profiles_active",
+            "user_id",
+            unique=True,
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active"),
+        ),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    profile_data = Column(JSON, nullable=False)  # JSONB in PostgreSQL
+    profile_data = Column(_JSON_DOC, nullable=False)
     version = Column(Integer, default=1)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -41,13 +58,17 @@ class UserProfile(Base):
 class JobAnalysis(Base):
     """Job posting analysis results."""
     __tablename__ = "job_analyses"
+    # History pages are keyset-paginated on (created_at, id) per user.
+    __table_args__ = (
+        Index("ix_job_analyses_user_created", "user_id", "created_at", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     job_url = Column(String(500))
     job_title = Column(String(200))
     company_name = Column(String(200))
-    analysis_data = Column(JSON, nullable=False)
+    analysis_data = Column(_JSON_DOC, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
@@ -58,6 +79,10 @@ class JobAnalysis(Base):
 class GeneratedContent(Base):
     """Generated CVs, bios, and other content."""
     __tablename__ = "generated_content"
+    # History pages are keyset-paginated on (created_at, id) per user.
+    __table_args__ = (
+        Index("ix_generated_content_user_created", "user_id", "created_at", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -65,7 +90,9 @@ class GeneratedContent(Base):
     content_type = Column(String(50), nullable=False)  # 'cv', 'bio', 'cover_letter'
     content = Column(Text, nullable=False)
     format = Column(String(50), nullable=False)  # 'markdown', 'pdf', 'docx'
-    metadata = Column(JSON)  # Additional metadata like style, template, etc.
+    # Attribute renamed: 'metadata' shadows the declarative registry's
+    # MetaData object. The database column keeps its original name.
+    content_metadata = Column("metadata", _JSON_DOC)  # style, template, etc.
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
@@ -1,31 +1,75 @@
-from typing import Optional, List
+import asyncio
+from typing import Dict, Optional, List
+from sqlalchemy import insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 from ..models import User, UserProfile
-from ...utils.security import get_password_hash, verify_password
+from ...utils.security import (
+    get_password_hash,
+    get_password_hash_async,
+    verify_password_async,
+)
+
+# Hashed once at import so a login against an unknown email still pays
+# for a full bcrypt verification; without it, the fast no-user return
+# tells an attacker which emails exist by timing alone.
+_DUMMY_HASH = get_password_hash("invalid-password-placeholder")
 
 
 class UserRepository:
     """Repository for user-related database operations."""
-    
+
+    # One instance is built per request; slots skip the per-instance
+    # __dict__ allocation for this single-attribute wrapper.
+    __slots__ = ("session",)
+
     def __init__(self, session: AsyncSession):
         self.session = session
     
     async def create_user(self, email: str, password: str, first_name: str = None, last_name: str = None) -> User:
         """Create a new user."""
-        password_hash = get_password_hash(password)
-        user = User(
-            email=email,
-            password_hash=password_hash,
-            first_name=first_name,
-            last_name=last_name
+        password_hash = await get_password_hash_async(password)
+        # INSERT ... RETURNING hands back the row with its server
+        # defaults populated; the request-scoped session commits once at
+        # the end of the request.
+        result = await self.session.execute(
+            insert(User)
+            .values(
+                email=email,
+                password_hash=password_hash,
+                first_name=first_name,
+                last_name=last_name,
+            )
+            .returning(User)
         )
-        self.session.add(user)
-        await self.session.commit()
-        await self.session.refresh(user)
-        return user
+        return result.scalar_one()
     
+    async def create_users_bulk(self, users: List[Dict]) -> List[User]:
+        """Create many users in one INSERT.
+
+        Each entry needs 'email' and 'password' plus optional name keys.
+        Hashes are computed concurrently on the thread pool, then a
+        single multi-row INSERT ... RETURNING persists everything in one
+        round-trip and one commit - instead of one of each per user.
+        """
+        hashes = await asyncio.gather(
+            *(get_password_hash_async(u["password"]) for u in users)
+        )
+        rows = [
+            {
+                "email": u["email"],
+                "password_hash": password_hash,
+                "first_name": u.get("first_name"),
+                "last_name": u.get("last_name"),
+            }
+            for u, password_hash in zip(users, hashes)
+        ]
+        result = await self.session.execute(
+            insert(User).values(rows).returning(User)
+        )
+        return list(result.scalars())
+
     async def get_user_by_email(self, email: str) -> Optional[User]:
         """Get user by email address."""
         result = await self.session.execute(
@@ -39,30 +83,55 @@ class UserRepository:
             select(User).where(User.id == user_id)
         )
         return result.scalar_one_or_none()
+
+    async def get_user_with_profile(self, user_id: int) -> Optional[User]:
+        """Get user with active profile and analyses eagerly loaded.
+
+        selectinload batches each collection into a single IN query, so
+        callers touching the relationships avoid one lazy-load round-trip
+        per collection. Auth keeps using the plain lookups above and never
+        pays for the extra queries.
+        """
+        result = await self.session.execute(
+            select(User)
+            .where(User.id == user_id)
+            .options(
+                selectinload(User.profiles.and_(UserProfile.is_active == True)),
+                selectinload(User.job_analyses),
+            )
+        )
+        return result.scalar_one_or_none()
     
     async def authenticate_user(self, email: str, password: str) -> Optional[User]:
         """Authenticate user credentials."""
         user = await self.get_user_by_email(email)
-        if user and verify_password(password, user.password_hash):
+        # Verify against a dummy hash when the user is missing so both
+        # outcomes take one bcrypt check.
+        password_hash = user.password_hash if user else _DUMMY_HASH
+        valid = await verify_password_async(password, password_hash)
+        if user and valid:
             return user
         return None
     
     async def update_user(self, user_id: int, **kwargs) -> Optional[User]:
         """Update user information."""
-        user = await self.get_user_by_id(user_id)
-        if user:
-            for key, value in kwargs.items():
-                if hasattr(user, key):
-                    setattr(user, key, value)
-            await self.session.commit()
-            await self.session.refresh(user)
-        return user
+        # One UPDATE ... RETURNING instead of SELECT, attribute-by-
+        # attribute mutation, commit and refresh. Unknown keys are
+        # filtered against the real columns rather than hasattr.
+        values = {k: v for k, v in kwargs.items() if k in User.__table__.columns}
+        if not values:
+            return await self.get_user_by_id(user_id)
+        result = await self.session.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(**values)
+            .returning(User)
+        )
+        return result.scalar_one_or_none()
     
     async def deactivate_user(self, user_id: int) -> bool:
         """Deactivate a user account."""
-        user = await self.get_user_by_id(user_id)
-        if user:
-            user.is_active = False
-            await self.session.commit()
-            return True
-        return False
\ No newline at end of file
+        result = await self.session.execute(
+            update(User).where(User.id == user_id).values(is_active=False)
+        )
+        return result.rowcount > 0
\ No newline at end of file
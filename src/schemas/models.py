@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, EmailStr, validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 
 
 # User Schemas
@@ -13,7 +13,8 @@ class UserBase(BaseModel):
 class UserCreate(UserBase):
     password: str
     
-    @validator('password')
+    @field_validator('password')
+    @classmethod
     def validate_password(cls, v):
         if len(v) < 8:
             raise ValueError('Password must be at least 8 characters long')
@@ -30,8 +31,7 @@ class UserResponse(UserBase):
     is_active: bool
     created_at: datetime
     
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserUpdate(BaseModel):
@@ -127,8 +127,7 @@ class UserProfileResponse(BaseModel):
     is_active: bool
     created_at: datetime
     
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Job Analysis Schemas
@@ -165,6 +164,18 @@ class JobAnalysisData(BaseModel):
     remote_option: Optional[str] = None
 
 
+class JobAnalysisSummary(BaseModel):
+    """History-row view of an analysis; omits the analysis_data blob."""
+    id: int
+    user_id: int
+    job_url: Optional[str]
+    job_title: Optional[str]
+    company_name: Optional[str]
+    created_at: datetime
+    
+    model_config = ConfigDict(from_attributes=True)
+
+
 class JobAnalysisResponse(BaseModel):
     id: int
     user_id: int
@@ -174,8 +185,7 @@ class JobAnalysisResponse(BaseModel):
     analysis_data: JobAnalysisData
     created_at: datetime
     
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Content Generation Schemas
@@ -188,6 +198,18 @@ class ContentGenerateRequest(BaseModel):
     additional_instructions: Optional[str] = None
 
 
+class ContentSummary(BaseModel):
+    """History-row view of generated content; omits the content body."""
+    id: int
+    user_id: int
+    job_analysis_id: Optional[int]
+    content_type: str
+    format: str
+    created_at: datetime
+    
+    model_config = ConfigDict(from_attributes=True)
+
+
 class ContentResponse(BaseModel):
     id: int
     user_id: int
@@ -195,8 +217,9 @@ class ContentResponse(BaseModel):
     content_type: str
     content: str
     format: str
-    metadata: Optional[Dict[str, Any]] = None
+    # Reads the ORM attribute content_metadata but keeps 'metadata' as the
+    # JSON key so API responses are unchanged.
+    metadata: Optional[Dict[str, Any]] = Field(None, validation_alias="content_metadata")
     created_at: datetime
     
-    class Config:
-        orm_mode = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
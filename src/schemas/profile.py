@@ -0,0 +1,86 @@
+"""
+Typed profile schema for schema-specialized JSON parsing.
+
+Mirrors the profile shape in ``schemas.models.UserProfileData`` using
+msgspec Structs, so profile files decode on a C-level path specialized
+to this schema (with validation) instead of the generic dict parser.
+"""
+from typing import Dict, List, Optional
+
+import msgspec
+
+
+class PersonalInfo(msgspec.Struct):
+    full_name: Optional[str] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    location: Optional[str] = None
+    linkedin: Optional[str] = None
+    portfolio: Optional[str] = None
+    github: Optional[str] = None
+
+
+class WorkExperience(msgspec.Struct):
+    company: str
+    position: str
+    start_date: str
+    description: str
+    end_date: Optional[str] = None
+    achievements: List[str] = msgspec.field(default_factory=list)
+    technologies: List[str] = msgspec.field(default_factory=list)
+
+
+class Education(msgspec.Struct):
+    institution: str
+    degree: str
+    field_of_study: str
+    start_date: str
+    end_date: Optional[str] = None
+    gpa: Optional[str] = None
+    achievements: List[str] = msgspec.field(default_factory=list)
+
+
+class Project(msgspec.Struct):
+    name: str
+    description: str
+    technologies: List[str] = msgspec.field(default_factory=list)
+    url: Optional[str] = None
+    github_url: Optional[str] = None
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+
+
+class Certification(msgspec.Struct):
+    name: str
+    issuer: str
+    date_obtained: str
+    expiry_date: Optional[str] = None
+    credential_id: Optional[str] = None
+    url: Optional[str] = None
+
+
+class UserProfile(msgspec.Struct):
+    personal_info: PersonalInfo = msgspec.field(default_factory=PersonalInfo)
+    professional_summary: str = ""
+    technical_skills: Dict[str, List[str]] = msgspec.field(default_factory=dict)
+    soft_skills: List[str] = msgspec.field(default_factory=list)
+    work_experience: List[WorkExperience] = msgspec.field(default_factory=list)
+    education: List[Education] = msgspec.field(default_factory=list)
+    projects: List[Project] = msgspec.field(default_factory=list)
+    certifications: List[Certification] = msgspec.field(default_factory=list)
+    languages: List[str] = msgspec.field(default_factory=list)
+    # msgspec drops unknown keys on decode, so every section a profile
+    # file may carry must be declared here or it silently vanishes from
+    # the prompts built downstream.
+    industry_expertise: List[str] = msgspec.field(default_factory=list)
+    specializations: List[str] = msgspec.field(default_factory=list)
+
+
+def decode_profile(data: bytes) -> UserProfile:
+    """Decode and validate raw profile JSON into a typed UserProfile."""
+    return msgspec.json.decode(data, type=UserProfile)
+
+
+def profile_to_dict(profile: UserProfile) -> Dict:
+    """Convert a typed profile back to plain dicts for the agent prompts."""
+    return msgspec.to_builtins(profile)
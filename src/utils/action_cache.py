@@ -0,0 +1,51 @@
+"""
+Task-level output cache for CLI pipeline stages.
+
+Caches the final output of each pipeline stage (job analysis, CV
+generation, bio generation) keyed on the stage name plus a hash of its
+inputs, so repeated runs over the same sample data read from disk
+instead of re-running the full LLM pipeline.
+"""
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Optional
+
+
+class ActionCache:
+    """Disk-backed cache mapping (action name, input hash) to stage output."""
+
+    def __init__(self, cache_dir: str = ".cache/actions"):
+        self.cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def input_hash(**inputs: Any) -> str:
+        """Compute a stable hash of a stage's keyword inputs."""
+        canonical = json.dumps(inputs, sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def _path(self, action_name: str, input_hash: str) -> Path:
+        return self.cache_dir / f"{action_name}_{input_hash}.json"
+
+    def get(self, action_name: str, input_hash: str) -> Optional[Any]:
+        path = self._path(action_name, input_hash)
+        if not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text())
+        except (json.JSONDecodeError, OSError):
+            return None
+
+    def set(self, action_name: str, input_hash: str, value: Any) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._path(action_name, input_hash).write_text(json.dumps(value))
+
+    def clear(self) -> int:
+        """Remove all cached entries. Returns number of entries removed."""
+        if not self.cache_dir.exists():
+            return 0
+        removed = 0
+        for path in self.cache_dir.glob("*.json"):
+            path.unlink(missing_ok=True)
+            removed += 1
+        return removed
@@ -1,7 +1,8 @@
-import os
+from functools import lru_cache
+from pathlib import Path
 from typing import List
-from pydantic_settings import BaseSettings
-from pydantic import validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import field_validator
 
 
 class Settings(BaseSettings):
@@ -9,9 +10,14 @@ class Settings(BaseSettings):
     github_token: str
     openai_api_key: str = ""
     default_model_id: str = "gpt-4.1-mini"
+    max_concurrency: int = 5  # Cap on simultaneous LLM calls per fan-out
+    llm_concurrency: int = 8  # Cap on in-flight LLM-backed API requests
+    llm_timeout_seconds: float = 120.0  # Per-request LLM deadline
     
     # Database Configuration
     database_url: str = "sqlite+aiosqlite:///./cv_tailor.db"
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
     
     # Security Settings
     secret_key: str
@@ -20,6 +26,7 @@ class Settings(BaseSettings):
     
     # Application Settings
     debug: bool = False
+    workers: int = 0  # Uvicorn worker count; 0 = derive from CPU count
     app_name: str = "CV Tailor Agent"
     version: str = "1.0.0"
     
@@ -34,7 +41,8 @@ class Settings(BaseSettings):
     # Rate Limiting
     rate_limit_per_minute: int = 60
 
-    @validator('cors_origins', pre=True)
+    @field_validator('cors_origins', mode='before')
+    @classmethod
     def assemble_cors_origins(cls, v):
         if isinstance(v, str):
             return [i.strip() for i in v.split(",")]
@@ -42,14 +50,26 @@ class Settings(BaseSettings):
             return v
         return []
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=False)
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the settings once; .env parsing and validation are not free."""
+    return Settings()
+
+
+def ensure_output_dirs() -> None:
+    """Create the output/temp directories on first use.
 
-# Ensure output directories exist
-os.makedirs(settings.output_directory, exist_ok=True)
-os.makedirs(settings.temp_directory, exist_ok=True)
\ No newline at end of file
+    Called from startup and the export paths rather than at import, so
+    merely importing this module (tests, tooling) makes no filesystem
+    syscalls.
+    """
+    settings = get_settings()
+    Path(settings.output_directory).mkdir(parents=True, exist_ok=True)
+    Path(settings.temp_directory).mkdir(parents=True, exist_ok=True)
+
+
+# Global settings instance
+settings = get_settings()
\ No newline at end of file
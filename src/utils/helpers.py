@@ -2,10 +2,59 @@
 Helper utilities for the CV Tailor application.
 """
 import re
+from functools import lru_cache
 from typing import Dict, List, Any
 from datetime import datetime
-import markdown
-from io import StringIO
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional speedup
+    ahocorasick = None
+
+try:
+    import email_validator
+except ImportError:  # pragma: no cover - ships with pydantic[email]
+    email_validator = None
+
+# Patterns used on every call are compiled once here instead of going
+# through re's per-call cache lookup.
+_WS_RE = re.compile(r'\s+')
+_PROTO_RE = re.compile(r'^https?://')
+_WWW_RE = re.compile(r'^www\.')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_NON_DIGIT_RE = re.compile(r'\D')
+_URL_RE = re.compile(r'^https?://[^\s/$.?#].[^\s]*$')
+_UNSAFE_RE = re.compile(r'[^\w\s.-]')
+_MULTI_UNDERSCORE_RE = re.compile(r'_+')
+
+# Markdown constructs the generated CVs actually use; stripping them
+# directly avoids rendering an intermediate HTML document.
+_MD_LINK_RE = re.compile(r'\[([^\]]*)\]\([^)]*\)')
+_MD_EMPHASIS_RE = re.compile(r'(\*{1,3}|`{1,3})(.+?)\1', re.DOTALL)
+# Underscore emphasis only counts at word boundaries; without the
+# lookarounds, snake_case identifiers lose their underscores.
+_MD_UNDERSCORE_RE = re.compile(r'(?<!\w)(_{1,3})(.+?)\1(?!\w)', re.DOTALL)
+_MD_HEADER_RE = re.compile(r'^#{1,6}\s*', re.MULTILINE)
+_MD_LIST_RE = re.compile(r'^\s*(?:[-*+]|\d+\.)\s+', re.MULTILINE)
+
+# Common HTML entities, replaced in one alternation pass rather than one
+# full string scan per entity.
+_HTML_ENTITIES = {
+    '&nbsp;': ' ',
+    '&amp;': '&',
+    '&lt;': '<',
+    '&gt;': '>',
+    '&quot;': '"',
+    '&#39;': "'",
+    '&mdash;': '—',
+    '&ndash;': '–'
+}
+_HTML_ENTITY_RE = re.compile('|'.join(re.escape(e) for e in _HTML_ENTITIES))
+
+# Anything clean_text would actually change: runs of whitespace,
+# whitespace other than a plain space, or a known entity. If none match,
+# the text can be returned as-is.
+_DIRTY_RE = re.compile(r'\s\s|[^\S ]|&(?:nbsp|amp|lt|gt|quot|#39|mdash|ndash);')
 
 
 def clean_text(text: str) -> str:
@@ -13,23 +62,15 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
     
+    # Fast path: most pre-validated inputs need no rewriting at all
+    if not _DIRTY_RE.search(text):
+        return text.strip()
+    
     # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text.strip())
-    
-    # Remove common HTML entities
-    html_entities = {
-        '&nbsp;': ' ',
-        '&amp;': '&',
-        '&lt;': '<',
-        '&gt;': '>',
-        '&quot;': '"',
-        '&#39;': "'",
-        '&mdash;': '—',
-        '&ndash;': '–'
-    }
-    
-    for entity, replacement in html_entities.items():
-        text = text.replace(entity, replacement)
+    text = _WS_RE.sub(' ', text.strip())
+    
+    # Replace common HTML entities in a single pass
+    text = _HTML_ENTITY_RE.sub(lambda m: _HTML_ENTITIES[m.group()], text)
     
     return text
 
@@ -40,9 +81,9 @@ def extract_domain_from_url(url: str) -> str:
         return ""
     
     # Remove protocol
-    domain = re.sub(r'^https?://', '', url)
+    domain = _PROTO_RE.sub('', url)
     # Remove www
-    domain = re.sub(r'^www\.', '', domain)
+    domain = _WWW_RE.sub('', domain)
     # Remove path
     domain = domain.split('/')[0]
     
@@ -54,13 +95,14 @@ def format_date_range(start_date: str, end_date: str = None) -> str:
     if not start_date:
         return ""
     
-    # Try to parse and format dates
+    # Try to parse and format dates (fromisoformat is C-implemented and
+    # much cheaper than strptime's per-call format parsing)
     try:
-        start = datetime.strptime(start_date, "%Y-%m-%d")
+        start = datetime.fromisoformat(start_date)
         start_str = start.strftime("%B %Y")
         
         if end_date:
-            end = datetime.strptime(end_date, "%Y-%m-%d")
+            end = datetime.fromisoformat(end_date)
             end_str = end.strftime("%B %Y")
             return f"{start_str} - {end_str}"
         else:
@@ -76,6 +118,7 @@ def format_date_range(start_date: str, end_date: str = None) -> str:
 def calculate_experience_years(work_experience: List[Dict]) -> float:
     """Calculate total years of experience from work history."""
     total_months = 0
+    now = datetime.now()
     
     for job in work_experience:
         start_date = job.get('start_date')
@@ -85,12 +128,12 @@ def calculate_experience_years(work_experience: List[Dict]) -> float:
             continue
         
         try:
-            start = datetime.strptime(start_date, "%Y-%m-%d")
+            start = datetime.fromisoformat(start_date)
             
             if end_date:
-                end = datetime.strptime(end_date, "%Y-%m-%d")
+                end = datetime.fromisoformat(end_date)
             else:
-                end = datetime.now()
+                end = now
             
             # Calculate months
             months = (end.year - start.year) * 12 + (end.month - start.month)
@@ -103,19 +146,30 @@ def calculate_experience_years(work_experience: List[Dict]) -> float:
     return round(total_months / 12, 1)
 
 
+@lru_cache(maxsize=32)
+def _skill_automaton(skills: tuple):
+    """Build (and memoize) an Aho-Corasick automaton for a skill list."""
+    automaton = ahocorasick.Automaton()
+    for skill in skills:
+        automaton.add_word(skill.lower(), skill)
+    automaton.make_automaton()
+    return automaton
+
+
 def extract_skills_from_text(text: str, known_skills: List[str] = None) -> List[str]:
     """Extract potential skills from text using pattern matching."""
     if not text or not known_skills:
         return []
     
-    found_skills = []
     text_lower = text.lower()
     
-    for skill in known_skills:
-        if skill.lower() in text_lower:
-            found_skills.append(skill)
+    if ahocorasick is not None:
+        # One linear scan over the text finds every skill at once,
+        # instead of one substring search per known skill.
+        automaton = _skill_automaton(tuple(known_skills))
+        return list({skill for _, skill in automaton.iter(text_lower)})
     
-    return list(set(found_skills))  # Remove duplicates
+    return list({skill for skill in known_skills if skill.lower() in text_lower})
 
 
 def markdown_to_plain_text(markdown_text: str) -> str:
@@ -123,16 +177,15 @@ def markdown_to_plain_text(markdown_text: str) -> str:
     if not markdown_text:
         return ""
     
-    # Convert markdown to HTML first
-    html = markdown.markdown(markdown_text)
-    
-    # Remove HTML tags
-    clean_text_content = re.sub(r'<[^>]+>', '', html)
+    # Strip markdown syntax directly - no intermediate HTML document
+    text = _MD_LINK_RE.sub(r'\1', markdown_text)
+    text = _MD_EMPHASIS_RE.sub(r'\2', text)
+    text = _MD_UNDERSCORE_RE.sub(r'\2', text)
+    text = _MD_HEADER_RE.sub('', text)
+    text = _MD_LIST_RE.sub('', text)
     
     # Clean up extra whitespace
-    clean_text_content = re.sub(r'\s+', ' ', clean_text_content.strip())
-    
-    return clean_text_content
+    return _WS_RE.sub(' ', text.strip())
 
 
 def truncate_text(text: str, max_length: int, add_ellipsis: bool = True) -> str:
@@ -151,8 +204,26 @@ def validate_email(email: str) -> bool:
     if not email:
         return False
     
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_RE.match(email))
+
+
+def validate_email_strict(email: str) -> bool:
+    """Validate email with the full RFC parser behind pydantic's EmailStr.
+
+    Use this for addresses that did not already pass through an EmailStr
+    field; inputs that did are proven valid and need no re-check.
+    """
+    if not email:
+        return False
+    
+    if email_validator is None:
+        return validate_email(email)
+    
+    try:
+        email_validator.validate_email(email, check_deliverability=False)
+        return True
+    except email_validator.EmailNotValidError:
+        return False
 
 
 def validate_phone(phone: str) -> bool:
@@ -161,7 +232,7 @@ def validate_phone(phone: str) -> bool:
         return False
     
     # Remove all non-digit characters
-    digits = re.sub(r'\D', '', phone)
+    digits = _NON_DIGIT_RE.sub('', phone)
     
     # Check if it's a reasonable phone number length
     return 10 <= len(digits) <= 15
@@ -172,8 +243,13 @@ def validate_url(url: str) -> bool:
     if not url:
         return False
     
-    pattern = r'^https?://[^\s/$.?#].[^\s]*$'
-    return bool(re.match(pattern, url))
+    return bool(_URL_RE.match(url))
+
+
+@lru_cache(maxsize=256)
+def _normalized_skills(skills: tuple) -> frozenset:
+    """Memoize the lowered skill set for a given skill tuple."""
+    return frozenset(skill.lower() for skill in skills)
 
 
 def score_skill_match(user_skills: List[str], required_skills: List[str]) -> float:
@@ -181,12 +257,13 @@ def score_skill_match(user_skills: List[str], required_skills: List[str]) -> flo
     if not user_skills or not required_skills:
         return 0.0
     
-    user_skills_lower = [skill.lower() for skill in user_skills]
-    required_skills_lower = [skill.lower() for skill in required_skills]
-    
-    matched_skills = set(user_skills_lower) & set(required_skills_lower)
+    # Scoring many candidates against one job (or vice versa) re-lowers
+    # the same lists repeatedly; the cache reduces each call to one
+    # C-level set intersection.
+    user = _normalized_skills(tuple(user_skills))
+    required = _normalized_skills(tuple(required_skills))
     
-    return len(matched_skills) / len(required_skills_lower)
+    return len(user & required) / len(required)
 
 
 def generate_filename(content_type: str, user_id: int, timestamp: datetime = None) -> str:
@@ -201,12 +278,12 @@ def generate_filename(content_type: str, user_id: int, timestamp: datetime = Non
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename by removing unsafe characters."""
     # Remove or replace unsafe characters
-    safe_filename = re.sub(r'[^\w\s.-]', '_', filename)
+    safe_filename = _UNSAFE_RE.sub('_', filename)
     
     # Replace spaces with underscores
     safe_filename = safe_filename.replace(' ', '_')
     
     # Remove multiple consecutive underscores
-    safe_filename = re.sub(r'_+', '_', safe_filename)
+    safe_filename = _MULTI_UNDERSCORE_RE.sub('_', safe_filename)
     
     return safe_filename.strip('_')
\ No newline at end of file
@@ -0,0 +1,35 @@
+"""
+Shared HTTP session for outbound requests.
+
+Creating a new aiohttp session per call throws away the connection pool,
+so every fetch pays TCP + TLS setup again. A single process-wide session
+keeps connections alive across LLM and job-page fetches.
+"""
+from typing import Optional
+
+import aiohttp
+
+_session: Optional[aiohttp.ClientSession] = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Return the shared ClientSession, creating it lazily on first use."""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=20,
+                ttl_dns_cache=300,
+                keepalive_timeout=60
+            ),
+            timeout=aiohttp.ClientTimeout(total=15)
+        )
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared session (call on application shutdown)."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
@@ -0,0 +1,152 @@
+"""
+Local response cache for LLM-backed generation calls.
+
+Generation requests are deterministic for a given (model, prompt inputs)
+pair, so repeated CLI runs with the same profile/job/style can reuse the
+previous completion instead of paying full LLM latency and token cost.
+"""
+import hashlib
+import json
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Protocol
+
+import orjson
+
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+
+# Cached CV/bio text is highly redundant English, so zstd level 3 packs
+# it roughly 3:1 - more entries fit in the OS page cache for the same
+# footprint. Shared (de)compressors are reused across all entries.
+_CCTX = zstd.ZstdCompressor(level=3) if zstd is not None else None
+_DCTX = zstd.ZstdDecompressor() if zstd is not None else None
+
+# Any of these while reading an entry means "treat as a cache miss";
+# a truncated .json.zst should degrade exactly like corrupt plain JSON.
+_READ_ERRORS = (orjson.JSONDecodeError, OSError)
+if zstd is not None:
+    _READ_ERRORS = _READ_ERRORS + (zstd.ZstdError,)
+
+
+def cache_key(model: str, messages: Any, temperature: float = 0.0, tools: Any = None) -> str:
+    """Compute a stable cache key for an LLM call."""
+    payload = {
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+        "tools": tools,
+    }
+    canonical = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class CacheBackend(Protocol):
+    """Protocol for cache storage backends."""
+
+    async def get(self, key: str) -> Optional[Any]:
+        ...
+
+    async def set(self, key: str, value: Any) -> None:
+        ...
+
+    async def clear(self) -> int:
+        ...
+
+
+class MemoryBackend:
+    """In-memory LRU cache backend."""
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Any]:
+        if key not in self._entries:
+            return None
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    async def set(self, key: str, value: Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def clear(self) -> int:
+        removed = len(self._entries)
+        self._entries.clear()
+        return removed
+
+
+class FileBackend:
+    """File-based cache backend storing one JSON file per entry.
+
+    Entries are zstd-compressed (.json.zst) when zstandard is installed;
+    plain .json files written by older versions remain readable.
+    """
+
+    def __init__(self, cache_dir: str = ".cache/llm"):
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, key: str) -> Path:
+        suffix = ".json.zst" if _CCTX is not None else ".json"
+        return self.cache_dir / f"{key}{suffix}"
+
+    async def get(self, key: str) -> Optional[Any]:
+        compressed_path = self.cache_dir / f"{key}.json.zst"
+        plain_path = self.cache_dir / f"{key}.json"
+        try:
+            if _DCTX is not None and compressed_path.exists():
+                return orjson.loads(_DCTX.decompress(compressed_path.read_bytes()))
+            if plain_path.exists():
+                return orjson.loads(plain_path.read_bytes())
+        except _READ_ERRORS:
+            return None
+        return None
+
+    async def set(self, key: str, value: Any) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        encoded = orjson.dumps(value)
+        if _CCTX is not None:
+            encoded = _CCTX.compress(encoded)
+        self._path(key).write_bytes(encoded)
+
+    async def clear(self) -> int:
+        """Delete every cached entry (compressed and plain). Returns count."""
+        removed = 0
+        if not self.cache_dir.exists():
+            return removed
+        for pattern in ("*.json", "*.json.zst"):
+            for entry in self.cache_dir.glob(pattern):
+                try:
+                    entry.unlink()
+                    removed += 1
+                except OSError:
+                    continue
+        return removed
+
+
+class LLMCache:
+    """Cache for LLM responses with hit/miss statistics."""
+
+    def __init__(self, backend: Optional[CacheBackend] = None):
+        self.backend: CacheBackend = backend if backend is not None else FileBackend()
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0}
+
+    async def get(self, key: str) -> Optional[Any]:
+        value = await self.backend.get(key)
+        if value is None:
+            self.stats["misses"] += 1
+        else:
+            self.stats["hits"] += 1
+        return value
+
+    async def set(self, key: str, value: Any) -> None:
+        await self.backend.set(key, value)
+
+    async def clear(self) -> int:
+        """Drop all cached responses. Returns the number removed."""
+        return await self.backend.clear()
@@ -54,13 +54,23 @@ async def test_microsoft_job():
     print(f"🔑 Key Keywords: {', '.join(job_analysis.get('keywords', []))}")
     print("="*60)
     
-    # Generate tailored CV with gap analysis
-    print("\n📝 Generating tailored CV with gap analysis...")
-    cv_result = await cv_tailor.generate_tailored_cv(
-        user_profile=profile_data,
-        job_analysis=job_analysis,
-        style="professional",
-        include_gap_analysis=True
+    # Generate the tailored CV and the bio concurrently - both depend
+    # only on the profile and the finished job analysis, so the wall
+    # clock is max(cv, bio) instead of their sum
+    print("\n📝 Generating tailored CV with gap analysis and bio...")
+    cv_result, bio_content = await asyncio.gather(
+        cv_tailor.generate_tailored_cv(
+            user_profile=profile_data,
+            job_analysis=job_analysis,
+            style="professional",
+            include_gap_analysis=True
+        ),
+        bio_generator.generate_professional_bio(
+            user_profile=profile_data,
+            job_context=job_analysis,
+            length="medium",
+            context="presentation"
+        )
     )
     
     print("\n" + "="*80)
@@ -127,15 +137,6 @@ async def test_microsoft_job():
         
         print("="*80)
     
-    # Generate bio
-    print("\n✍️ Generating professional bio...")
-    bio_content = await bio_generator.generate_professional_bio(
-        user_profile=profile_data,
-        job_context=job_analysis,
-        length="medium",
-        context="presentation"
-    )
-    
     print("\n" + "="*80)
     print("GENERATED BIO")
     print("="*80)